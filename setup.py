@@ -89,6 +89,7 @@ setup(
         "performance": [
             "psutil>=5.9.0",
             "memory-profiler>=0.61.0",
+            "orjson>=3.9.0",
         ],
         "packaging": [
             "pyinstaller>=5.13.0",
@@ -105,6 +106,7 @@ setup(
             "mutagen>=1.47.0",
             "psutil>=5.9.0",
             "memory-profiler>=0.61.0",
+            "orjson>=3.9.0",
             "pyinstaller>=5.13.0",
             "cx-Freeze>=6.15.0",
         ],
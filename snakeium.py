@@ -24,6 +24,7 @@ Usage:
     python snakeium.py
     python snakeium.py --fullscreen
     python snakeium.py --no-music
+    python snakeium.py --static-background
 
 Author: GHOSTKITTY APPS
 Version: 2.1.0
@@ -39,6 +40,8 @@ import colorsys
 import time
 import sys
 import json
+import traceback
+from collections import OrderedDict
 from enum import Enum
 from typing import List, Tuple, Optional
 from pathlib import Path
@@ -136,6 +139,8 @@ class Config:
     ENABLE_VSYNC = True
     ENABLE_PARTICLES = True
     ENABLE_GEOMETRIC_EFFECTS = False
+    # A static background lets gameplay frames redraw only dirty rectangles
+    ANIMATED_BACKGROUND = True
 
     # Persistence
     HIGH_SCORE_FILE = str(Path.home() / ".snakeium" / "high_scores.json")
@@ -159,6 +164,12 @@ TRIANGLE_SPEED = Config.TRIANGLE_SPEED
 SPIRAL_SPEED = Config.SPIRAL_SPEED
 SPIRAL_RADIUS_MAX = Config.SPIRAL_RADIUS_MAX
 
+# Screen rect of every grid cell, indexed CELL_RECTS[x][y]
+CELL_RECTS = [
+    [pygame.Rect(x * GRID_SIZE, y * GRID_SIZE, GRID_SIZE, GRID_SIZE) for y in range(GRID_HEIGHT)]
+    for x in range(GRID_WIDTH)
+]
+
 # ---------------------------------------------------------------------------
 # Colour palette
 # ---------------------------------------------------------------------------
@@ -173,6 +184,57 @@ NEON_ORANGE = (255, 165, 0)
 NEON_YELLOW = (255, 255, 0)
 DARK_GRAY = (40, 40, 40)
 
+# Body gradient lookup table: bucket = i * BODY_LUT_SIZE // len(body)
+BODY_LUT_SIZE = 64
+if HAS_NUMPY:
+    BODY_COLOR_LUT = tuple(
+        tuple(int(c) for c in row)
+        for row in np.rint(
+            np.linspace(1.0, 0.0, BODY_LUT_SIZE, endpoint=False)[:, None] * np.array(NEON_GREEN)
+        ).astype(np.uint8)
+    )
+else:
+    BODY_COLOR_LUT = tuple(
+        tuple(int(round(c * (1 - b / BODY_LUT_SIZE))) for c in NEON_GREEN)
+        for b in range(BODY_LUT_SIZE)
+    )
+
+
+# Fully saturated rainbow colour for each integer hue in degrees
+HUE_LUT = tuple(
+    tuple(int(c * 255) for c in colorsys.hsv_to_rgb(h / 360, 1, 1)) for h in range(360)
+)
+
+
+def hsv_to_rgb_array(h, s, v):
+    """Vectorised colorsys.hsv_to_rgb; returns uint8 RGB rows (requires NumPy)."""
+    h = np.asarray(h, dtype=np.float64)
+    s = np.broadcast_to(np.asarray(s, dtype=np.float64), h.shape)
+    v = np.broadcast_to(np.asarray(v, dtype=np.float64), h.shape)
+    i = np.floor(h * 6.0)
+    f = h * 6.0 - i
+    i = i.astype(np.int64) % 6
+    p = v * (1.0 - s)
+    q = v * (1.0 - s * f)
+    t = v * (1.0 - s * (1.0 - f))
+    r = np.choose(i, (v, q, p, p, t, v))
+    g = np.choose(i, (t, v, v, q, p, p))
+    b = np.choose(i, (p, p, t, v, v, q))
+    return (np.stack((r, g, b), axis=-1) * 255).astype(np.uint8)
+
+
+# Frames per grid step, indexed [boosted][base speed][len(body) // 8]
+MOVE_INTERVAL_LUT = tuple(
+    tuple(
+        tuple(
+            max(60 // max(1, int(min((spd + lb) * 1.8, 20) if boosted else spd + lb)), 1)
+            for lb in range(256)
+        )
+        for spd in range(21)
+    )
+    for boosted in (False, True)
+)
+
 
 class Direction(Enum):
     UP = (0, -1)
@@ -317,6 +379,109 @@ def create_snake_body_sprite(size, color, is_tail=False):
     return surf
 
 
+_sprite_cache: dict = {}
+
+
+def to_display_format(surface):
+    """Convert a surface to the display pixel format once a video mode is set."""
+    if pygame.display.get_surface() is None:
+        return surface
+    if surface.get_flags() & pygame.SRCALPHA:
+        return surface.convert_alpha()
+    return surface.convert()
+
+
+# Surface.fblits is only available in newer pygame builds
+_HAS_FBLITS = hasattr(pygame.Surface, "fblits")
+
+
+def blit_batch(surface, seq, want_rects=False):
+    """Blit (source, dest) pairs in one C call; return their rects only if asked."""
+    if want_rects:
+        return surface.blits(seq)
+    if _HAS_FBLITS:
+        surface.fblits(seq)
+    else:
+        surface.blits(seq, doreturn=False)
+    return []
+
+
+def get_particle_image(color, size):
+    """Return the cached filled-circle image for a particle colour and radius."""
+    key = ("particle", color, size)
+    image = _sprite_cache.get(key)
+    if image is None:
+        image = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
+        pygame.draw.circle(image, color, (size, size), size)
+        image = to_display_format(image)
+        _sprite_cache[key] = image
+    return image
+
+
+def get_powerup_image(power_type, pulse_size):
+    """Return the cached ring image for a power-up type and pulse size."""
+    key = ("powerup", power_type, pulse_size)
+    image = _sprite_cache.get(key)
+    if image is None:
+        radius = GRID_SIZE // 2 + pulse_size
+        image = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+        pygame.draw.circle(image, POWERUP_COLORS[power_type], (radius, radius), radius)
+        pygame.draw.circle(image, BLACK, (radius, radius), radius - 2)
+        image = to_display_format(image)
+        _sprite_cache[key] = image
+    return image
+
+
+def get_body_sprite(bucket, is_tail=False):
+    """Return the cached body/tail sprite for a gradient bucket."""
+    key = (bucket, is_tail)
+    sprite = _sprite_cache.get(key)
+    if sprite is None:
+        sprite = to_display_format(create_snake_body_sprite(GRID_SIZE, BODY_COLOR_LUT[bucket], is_tail))
+        _sprite_cache[key] = sprite
+    return sprite
+
+
+def get_head_sprite(direction):
+    """Return the cached head sprite for a direction."""
+    key = ("head", direction)
+    sprite = _sprite_cache.get(key)
+    if sprite is None:
+        sprite = to_display_format(create_snake_head_sprite(GRID_SIZE, direction, NEON_GREEN))
+        _sprite_cache[key] = sprite
+    return sprite
+
+
+def get_rainbow_sprite(hue, direction=None, is_tail=False):
+    """Return the cached rainbow head (when direction is given) or body sprite for a hue."""
+    key = ("rainbow", hue, direction, is_tail)
+    sprite = _sprite_cache.get(key)
+    if sprite is None:
+        if direction is not None:
+            sprite = create_snake_head_sprite(GRID_SIZE, direction, HUE_LUT[hue])
+        else:
+            sprite = create_snake_body_sprite(GRID_SIZE, HUE_LUT[hue], is_tail)
+        sprite = to_display_format(sprite)
+        _sprite_cache[key] = sprite
+    return sprite
+
+
+GLOW_SIZE = GRID_SIZE + 6
+_glow_lut: list = [None] * 360
+
+
+def get_glow_surface(hue):
+    """Return the pre-rendered rainbow glow surface for an integer hue."""
+    surf = _glow_lut[hue]
+    if surf is None:
+        surf = pygame.Surface((GLOW_SIZE, GLOW_SIZE), pygame.SRCALPHA)
+        pygame.draw.circle(surf, HUE_LUT[hue], (GLOW_SIZE // 2, GLOW_SIZE // 2), GLOW_SIZE // 2)
+        surf = to_display_format(surf)
+        surf.set_alpha(100)
+        _glow_lut[hue] = surf
+    return surf
+
+
 def create_apple_sprite(size):
     """Create an 8-bit style apple sprite."""
     surf = pygame.Surface((size, size), pygame.SRCALPHA)
@@ -344,6 +509,34 @@ def create_apple_sprite(size):
     return surf
 
 
+def get_apple_sprite():
+    """Return the cached apple sprite."""
+    sprite = _sprite_cache.get("apple")
+    if sprite is None:
+        sprite = _sprite_cache["apple"] = to_display_format(create_apple_sprite(GRID_SIZE))
+    return sprite
+
+
+def get_food_glow(glow_size):
+    """Return the cached layered food glow for a pulse size."""
+    key = ("food_glow", glow_size)
+    surf = _sprite_cache.get(key)
+    if surf is None:
+        surf = pygame.Surface((GRID_SIZE + glow_size * 4, GRID_SIZE + glow_size * 4), pygame.SRCALPHA)
+        for layer in range(3):
+            ls = glow_size + layer * 2
+            la = 60 - layer * 15
+            pygame.draw.circle(
+                surf, (255, 120, 120, max(0, la)),
+                (surf.get_width() // 2, surf.get_height() // 2),
+                GRID_SIZE // 2 + ls,
+            )
+        surf = to_display_format(surf)
+        surf.set_alpha(60)
+        _sprite_cache[key] = surf
+    return surf
+
+
 # ===================================================================
 # Visual effect classes
 # ===================================================================
@@ -446,19 +639,18 @@ class TriangleRipper:
     def draw(self, screen):
         if self.x < -200 or self.x > WINDOW_WIDTH + 200 or self.y < -200 or self.y > WINDOW_HEIGHT + 200:
             return
+        now = time.time()
+        trail_color = HUE_LUT[int(now * 50 + self.color_offset) % 360]
+        trail_len = max(1, len(self.trail_points))
         for i, (tx, ty) in enumerate(self.trail_points):
             if i % 2 == 0:
-                af = i / max(1, len(self.trail_points))
-                ts = max(1, int(self.size * af * 0.3))
+                ts = max(1, int(self.size * (i / trail_len) * 0.3))
                 if ts > 1:
-                    hue = (time.time() * 50 + self.color_offset) % 360
-                    rgb = colorsys.hsv_to_rgb(hue / 360, 1, 1)
-                    c = tuple(int(v * 255) for v in rgb)
                     try:
-                        pygame.draw.circle(screen, c, (int(tx), int(ty)), ts)
+                        pygame.draw.circle(screen, trail_color, (int(tx), int(ty)), ts)
                     except (ValueError, TypeError):
                         pass
-        hue = (time.time() * 80 + self.color_offset) % 360
+        hue = (now * 80 + self.color_offset) % 360
         rgb = colorsys.hsv_to_rgb(hue / 360, 1, 1)
         color = tuple(int(v * 255) for v in rgb)
         hs = self.size // 2
@@ -527,27 +719,105 @@ class PowerUpType(Enum):
     MEGA_FOOD = "mega"
 
 
-class Particle:
-    """Lightweight particle for visual feedback."""
+POWERUP_COLORS = {
+    PowerUpType.SPEED_BOOST: NEON_BLUE,
+    PowerUpType.SCORE_MULTIPLIER: NEON_YELLOW,
+    PowerUpType.RAINBOW_MODE: NEON_PURPLE,
+    PowerUpType.MEGA_FOOD: NEON_ORANGE,
+}
 
-    def __init__(self, x, y, color, velocity, lifetime=60):
-        self.x = x
-        self.y = y
-        self.color = color
-        self.vx, self.vy = velocity
-        self.lifetime = lifetime
-        self.max_lifetime = lifetime
-        self.size = random.randint(2, 6)
+FOOD_PARTICLE_COLORS = ((220, 20, 60), (255, 0, 0), (255, 69, 0))
 
-    def update(self):
-        self.x += self.vx
-        self.y += self.vy
-        self.lifetime -= 1
-        self.vy += 0.1  # gravity
 
-    def draw(self, screen):
-        if self.lifetime > 0:
-            pygame.draw.circle(screen, self.color[:3], (int(self.x), int(self.y)), self.size)
+class ParticleSystem:
+    """All live particles stored column-wise so physics runs as whole-array ops.
+
+    With numpy each particle is a row of ``state`` (x, y, vx, vy, lifetime)
+    plus its radius and an index into a palette of cached sprites; without
+    numpy the same columns live in a plain list of rows.
+    """
+
+    GRAVITY = 0.1
+
+    def __init__(self, max_particles=None):
+        self.max_particles = max_particles or Config.MAX_PARTICLES
+        self._sprites: list = []
+        self._sprite_index: dict = {}
+        self.clear()
+
+    def clear(self):
+        if HAS_NUMPY:
+            self.state = np.empty((0, 5), dtype=np.float32)
+            self.sizes = np.empty(0, dtype=np.int32)
+            self.sprite_ids = np.empty(0, dtype=np.int32)
+        else:
+            self.rows = []
+
+    def __len__(self):
+        return len(self.state) if HAS_NUMPY else len(self.rows)
+
+    def _sprite_id(self, color, size):
+        key = (tuple(color[:3]), size)
+        idx = self._sprite_index.get(key)
+        if idx is None:
+            idx = self._sprite_index[key] = len(self._sprites)
+            self._sprites.append(get_particle_image(key[0], size))
+        return idx
+
+    def emit(self, positions, velocities, colors, sizes, lifetime=60):
+        """Add one particle per (position, velocity, colour, radius) entry."""
+        sprite_ids = [self._sprite_id(c, r) for c, r in zip(colors, sizes)]
+        if not sprite_ids:
+            return
+        if HAS_NUMPY:
+            new = np.empty((len(sprite_ids), 5), dtype=np.float32)
+            new[:, 0:2] = positions
+            new[:, 2:4] = velocities
+            new[:, 4] = lifetime
+            self.state = np.concatenate((self.state, new))
+            self.sizes = np.concatenate((self.sizes, np.asarray(sizes, dtype=np.int32)))
+            self.sprite_ids = np.concatenate((self.sprite_ids, np.asarray(sprite_ids, dtype=np.int32)))
+        else:
+            self.rows.extend(
+                [x, y, vx, vy, lifetime, r, i]
+                for (x, y), (vx, vy), r, i in zip(positions, velocities, sizes, sprite_ids)
+            )
+
+    def update(self):
+        """Advance one tick, drop expired particles and enforce the cap."""
+        cap = self.max_particles
+        if HAS_NUMPY:
+            state = self.state
+            state[:, 0:2] += state[:, 2:4]
+            state[:, 3] += self.GRAVITY
+            state[:, 4] -= 1
+            alive = state[:, 4] > 0
+            if not alive.all():
+                self.state = state[alive]
+                self.sizes = self.sizes[alive]
+                self.sprite_ids = self.sprite_ids[alive]
+            if len(self.state) > cap:
+                self.state = self.state[-cap:]
+                self.sizes = self.sizes[-cap:]
+                self.sprite_ids = self.sprite_ids[-cap:]
+            return
+        gravity = self.GRAVITY
+        for row in self.rows:
+            row[0] += row[2]
+            row[1] += row[3]
+            row[3] += gravity
+            row[4] -= 1
+        self.rows = [row for row in self.rows if row[4] > 0][-cap:]
+
+    def blit_sequence(self):
+        """Return (image, topleft) pairs for blit_batch."""
+        sprites = self._sprites
+        if HAS_NUMPY:
+            xs = (self.state[:, 0].astype(np.int32) - self.sizes).tolist()
+            ys = (self.state[:, 1].astype(np.int32) - self.sizes).tolist()
+            images = [sprites[i] for i in self.sprite_ids.tolist()]
+            return list(zip(images, zip(xs, ys)))
+        return [(sprites[row[6]], (int(row[0]) - row[5], int(row[1]) - row[5])) for row in self.rows]
 
 
 class PowerUp:
@@ -557,29 +827,28 @@ class PowerUp:
         self.x = x
         self.y = y
         self.type = power_type
-        self.spawn_time = time.time()
+        self.spawn_time = time.monotonic()
         self.lifetime = 10
         self.pulse = 0.0
 
     def update(self):
         self.pulse += 0.2
 
-    def is_expired(self):
-        return time.time() - self.spawn_time > self.lifetime
+    def is_expired(self, now=None):
+        if now is None:
+            now = time.monotonic()
+        return now - self.spawn_time > self.lifetime
 
-    def draw(self, screen):
+    def sprite(self):
+        """Return the (image, dest) pair for the current pulse frame."""
         pulse_size = int(5 + 3 * math.sin(self.pulse))
-        colors = {
-            PowerUpType.SPEED_BOOST: NEON_BLUE,
-            PowerUpType.SCORE_MULTIPLIER: NEON_YELLOW,
-            PowerUpType.RAINBOW_MODE: NEON_PURPLE,
-            PowerUpType.MEGA_FOOD: NEON_ORANGE,
-        }
-        color = colors[self.type]
-        cx = self.x * GRID_SIZE + GRID_SIZE // 2
-        cy = self.y * GRID_SIZE + GRID_SIZE // 2
-        pygame.draw.circle(screen, color, (cx, cy), GRID_SIZE // 2 + pulse_size)
-        pygame.draw.circle(screen, BLACK, (cx, cy), GRID_SIZE // 2 + pulse_size - 2)
+        radius = GRID_SIZE // 2 + pulse_size
+        cx, cy = CELL_RECTS[self.x][self.y].center
+        return get_powerup_image(self.type, pulse_size), (cx - radius, cy - radius)
+
+    def draw(self, screen):
+        image, dest = self.sprite()
+        return screen.blit(image, dest)
 
 
 # ===================================================================
@@ -661,6 +930,8 @@ class Snake:
 
     def __init__(self, speed=4):
         self.body = [(GRID_WIDTH // 2, GRID_HEIGHT // 2)]
+        # Segment count per cell, kept in step with body for O(1) lookups
+        self._cells = {self.body[0]: 1}
         self.direction = Direction.RIGHT
         self.grow = False
         self.speed = speed
@@ -672,7 +943,8 @@ class Snake:
 
         # Smooth movement
         self.move_timer = 0
-        self.move_interval = max(1, 60 // max(self.speed, 1))
+        self.move_interval = 1
+        self.update_move_interval()
         # Start with a move ready so snake responds immediately
         self.move_timer = self.move_interval
         self.smooth_positions: list = []
@@ -742,11 +1014,18 @@ class Snake:
         dx, dy = self.direction.value
         new_head = ((head_x + dx) % GRID_WIDTH, (head_y + dy) % GRID_HEIGHT)
 
+        cells = self._cells
         self.body.insert(0, new_head)
+        cells[new_head] = cells.get(new_head, 0) + 1
         if not self.grow:
-            self.body.pop()
+            tail = self.body.pop()
+            if cells[tail] == 1:
+                del cells[tail]
+            else:
+                cells[tail] -= 1
         else:
             self.grow = False
+            self.update_move_interval()
 
         self.target_positions = list(self.body)
 
@@ -778,6 +1057,7 @@ class Snake:
     def eat_powerup(self, powerup: PowerUp):
         if powerup.type == PowerUpType.SPEED_BOOST:
             self.speed_boost_timer = 300
+            self.update_move_interval()
         elif powerup.type == PowerUpType.SCORE_MULTIPLIER:
             self.score_multiplier = 3
             self.score_multiplier_timer = 600
@@ -791,6 +1071,8 @@ class Snake:
     def update_effects(self):
         if self.speed_boost_timer > 0:
             self.speed_boost_timer -= 1
+            if self.speed_boost_timer == 0:
+                self.update_move_interval()
         if self.score_multiplier_timer > 0:
             self.score_multiplier_timer -= 1
         else:
@@ -807,55 +1089,89 @@ class Snake:
         return base
 
     def update_move_interval(self):
-        self.move_interval = max(60 // int(self.get_current_speed()), 1)
+        """Recompute move_interval; called only when speed, length or boost change."""
+        length_bucket = len(self.body) // 8
+        if 0 <= self.speed <= 20 and length_bucket < 256:
+            self.move_interval = MOVE_INTERVAL_LUT[self.speed_boost_timer > 0][self.speed][length_bucket]
+        else:
+            self.move_interval = max(60 // max(1, int(self.get_current_speed())), 1)
+
+    def occupies(self, cell):
+        return cell in self._cells
 
     def check_collision(self):
-        return self.body[0] in self.body[1:]
+        return self._cells[self.body[0]] > 1
 
     def get_rainbow_color(self, index):
-        hue = (time.time() * 100 + index * 30) % 360
-        rgb = colorsys.hsv_to_rgb(hue / 360, 1, 1)
-        return tuple(int(c * 255) for c in rgb)
+        return HUE_LUT[int(time.time() * 100 + index * 30) % 360]
 
-    def draw(self, screen, particles):
+    @staticmethod
+    def _spawn_rainbow_particles(centers, particles, hue_base):
+        """Emit particles from ~40% of segments, drawing the random values in batches."""
+        if HAS_NUMPY:
+            picks = np.flatnonzero(np.random.random(len(centers)) < 0.4)
+            count = len(picks)
+            offsets = np.random.randint(0, 11, count)
+            hues = ((hue_base + (picks + offsets) * 30) % 360).astype(np.int32)
+            particles.emit(
+                np.asarray(centers, dtype=np.float32).reshape(-1, 2)[picks],
+                np.random.uniform(-3, 3, (count, 2)),
+                [HUE_LUT[h] for h in hues.tolist()],
+                np.random.randint(2, 7, count).tolist(),
+            )
+            return
+        picks = [i for i in range(len(centers)) if random.random() < 0.4]
+        particles.emit(
+            [centers[i] for i in picks],
+            [(random.uniform(-3, 3), random.uniform(-3, 3)) for _ in picks],
+            [HUE_LUT[int(hue_base + (i + random.randint(0, 10)) * 30) % 360] for i in picks],
+            [random.randint(2, 6) for _ in picks],
+        )
+
+    def draw(self, screen, particles, want_rects=True):
+        """Draw the snake; return the screen rects it touched when want_rects is set."""
         if SMOOTH_MOVEMENT and self.smooth_positions:
             positions = [(p[0], p[1]) for p in self.smooth_positions]
         else:
             positions = [(float(x), float(y)) for x, y in self.body]
 
+        n = len(positions)
+        last = n - 1
+        rainbow = self.rainbow_mode
+        direction = self.direction
+        half = GRID_SIZE // 2
+        hue_base = time.time() * 100
+        batch = []
+        add = batch.append
+        centers = []
+
         for i, (x, y) in enumerate(positions):
             if SUB_PIXEL_MOVEMENT:
                 px, py = x * GRID_SIZE, y * GRID_SIZE
             else:
                 px, py = int(x) * GRID_SIZE, int(y) * GRID_SIZE
 
-            if self.rainbow_mode:
-                color = self.get_rainbow_color(i)
+            if rainbow:
+                hue = int(hue_base + i * 30) % 360
+                if i == 0:
+                    sprite = get_rainbow_sprite(hue, direction)
+                else:
+                    sprite = get_rainbow_sprite(hue, is_tail=(i == last))
             elif i == 0:
-                color = NEON_GREEN
+                sprite = get_head_sprite(direction)
             else:
-                grad = 1 - (i / len(positions))
-                color = (int(NEON_GREEN[0] * grad), int(NEON_GREEN[1] * grad), int(NEON_GREEN[2] * grad))
+                sprite = get_body_sprite(min(BODY_LUT_SIZE - 1, i * BODY_LUT_SIZE // n), is_tail=(i == last))
+            add((sprite, (px, py)))
 
-            if i == 0:
-                sprite = create_snake_head_sprite(GRID_SIZE, self.direction, color)
-            elif i == len(positions) - 1:
-                sprite = create_snake_body_sprite(GRID_SIZE, color, is_tail=True)
-            else:
-                sprite = create_snake_body_sprite(GRID_SIZE, color, is_tail=False)
-            screen.blit(sprite, (px, py))
+            if rainbow:
+                add((get_glow_surface(hue), (px - 3, py - 3)))
+                centers.append((px + half, py + half))
 
-            if self.rainbow_mode:
-                glow_sz = GRID_SIZE + 6
-                glow_surf = pygame.Surface((glow_sz, glow_sz), pygame.SRCALPHA)
-                pygame.draw.circle(glow_surf, color, (glow_sz // 2, glow_sz // 2), glow_sz // 2)
-                glow_surf.set_alpha(100)
-                screen.blit(glow_surf, (px - 3, py - 3))
+        if rainbow:
+            self._spawn_rainbow_particles(centers, particles, hue_base)
 
-            if self.rainbow_mode and random.random() < 0.4:
-                pc = self.get_rainbow_color(i + random.randint(0, 10))
-                vel = (random.uniform(-3, 3), random.uniform(-3, 3))
-                particles.append(Particle(px + GRID_SIZE // 2, py + GRID_SIZE // 2, pc, vel))
+        # One batched call for the whole body instead of a blit per segment
+        return blit_batch(screen, batch, want_rects)
 
 
 # ===================================================================
@@ -870,7 +1186,7 @@ class Food:
         self.x = random.randint(0, GRID_WIDTH - 1)
         self.y = random.randint(0, GRID_HEIGHT - 1)
         self.pulse = 0.0
-        self.apple_sprite = create_apple_sprite(GRID_SIZE)
+        self.apple_sprite = get_apple_sprite()
         self.glow_intensity = 0.0
         self.bob_offset = 0.0
         self.sparkle_timer = 0
@@ -887,24 +1203,15 @@ class Food:
         y_pos = self.y * GRID_SIZE + bob_y
 
         glow_size = int(4 + 2 * math.sin(self.glow_intensity))
-        glow_surf = pygame.Surface((GRID_SIZE + glow_size * 4, GRID_SIZE + glow_size * 4), pygame.SRCALPHA)
-        for layer in range(3):
-            ls = glow_size + layer * 2
-            la = 60 - layer * 15
-            pygame.draw.circle(
-                glow_surf, (255, 120, 120, max(0, la)),
-                (glow_surf.get_width() // 2, glow_surf.get_height() // 2),
-                GRID_SIZE // 2 + ls,
-            )
-        glow_surf.set_alpha(60)
-        screen.blit(glow_surf, (x_pos - glow_size * 2, y_pos - glow_size * 2))
-        screen.blit(self.apple_sprite, (x_pos, int(y_pos)))
+        rect = screen.blit(get_food_glow(glow_size), (x_pos - glow_size * 2, y_pos - glow_size * 2))
+        rect.union_ip(screen.blit(self.apple_sprite, (x_pos, int(y_pos))))
 
         if self.sparkle_timer % 30 < 5:
             for _ in range(2):
                 sx = x_pos + random.randint(5, GRID_SIZE - 5)
                 sy = int(y_pos) + random.randint(5, GRID_SIZE - 5)
                 pygame.draw.circle(screen, WHITE, (sx, sy), random.randint(1, 3))
+        return rect
 
 
 # ===================================================================
@@ -923,6 +1230,10 @@ class StartMenu:
         ("NIGHTMARE", 12),
     ]
 
+    # Title glyphs are cached per (char, hue bucket); a bucket spans TITLE_HUE_STEP degrees
+    TITLE_HUE_STEP = 4
+    TITLE_GLYPH_CACHE_SIZE = 128
+
     def __init__(self, screen):
         self.screen = screen
         self.selected_option = 1  # default CLASSIC
@@ -935,6 +1246,23 @@ class StartMenu:
         self.menu_font = pygame.font.Font(None, max(44, WINDOW_WIDTH // 28))
         self.subtitle_font = pygame.font.Font(None, max(28, WINDOW_WIDTH // 45))
         self.hint_font = pygame.font.Font(None, max(24, WINDOW_WIDTH // 50))
+        self._scanlines: Optional[pygame.Surface] = None
+        self._title_glyph_cache: OrderedDict = OrderedDict()
+        self._title_shadows: dict = {}
+
+    def _get_scanlines(self, sw, sh):
+        """Return the scan-line overlay, rebuilding it only when the screen size changes."""
+        if self._scanlines is None or self._scanlines.get_size() != (sw, sh):
+            overlay = pygame.Surface((sw, sh), pygame.SRCALPHA)
+            if HAS_NUMPY:
+                alpha = pygame.surfarray.pixels_alpha(overlay)
+                alpha[:, ::3] = 15
+                del alpha
+            else:
+                for y in range(0, sh, 3):
+                    overlay.fill((0, 0, 0, 15), (0, y, sw, 1))
+            self._scanlines = to_display_format(overlay)
+        return self._scanlines
 
     def draw_background(self):
         """Draw a smooth dark gradient background with subtle animated stars."""
@@ -956,17 +1284,33 @@ class StartMenu:
             pygame.draw.rect(self.screen, (r, g, b), (0, y, sw, band_height))
 
         # Animated stars
+        now = time.time()
         for i, (sx, sy, speed, size) in enumerate(self.stars):
-            brightness = int(120 + 80 * math.sin(time.time() * speed + i))
+            brightness = int(120 + 80 * math.sin(now * speed + i))
             brightness = max(60, min(220, brightness))
             color = (brightness, brightness, brightness + 30)
             pygame.draw.circle(self.screen, color, (int(sx), int(sy)), size)
 
         # Subtle scan lines (very faint, every 3rd pixel)
-        overlay = pygame.Surface((sw, sh), pygame.SRCALPHA)
-        for y in range(0, sh, 3):
-            pygame.draw.line(overlay, (0, 0, 0, 15), (0, y), (sw, y), 1)
-        self.screen.blit(overlay, (0, 0))
+        self.screen.blit(self._get_scanlines(sw, sh), (0, 0))
+
+    def _get_title_glyph(self, ch, hue_bucket):
+        """Return cached (glow, main) surfaces for a title character, LRU-bounded."""
+        key = (ch, hue_bucket)
+        cache = self._title_glyph_cache
+        glyphs = cache.get(key)
+        if glyphs is not None:
+            cache.move_to_end(key)
+            return glyphs
+        rgb = colorsys.hsv_to_rgb(hue_bucket * self.TITLE_HUE_STEP / 360, 0.85, 1.0)
+        color = tuple(int(c * 255) for c in rgb)
+        glow = self.title_font.render(ch, True, tuple(min(255, c + 60) for c in color))
+        glow.set_alpha(40)
+        glyphs = (glow, self.title_font.render(ch, True, color))
+        cache[key] = glyphs
+        if len(cache) > self.TITLE_GLYPH_CACHE_SIZE:
+            cache.popitem(last=False)
+        return glyphs
 
     def draw_title(self):
         """Draw the SNAKEIUM title with clean styling."""
@@ -975,26 +1319,24 @@ class StartMenu:
         cw = max(65, WINDOW_WIDTH // 18)
         start_x = WINDOW_WIDTH // 2 - (len(title) * cw) // 2
 
+        now = time.time()
         for i, ch in enumerate(title):
-            hue = (time.time() * 30 + i * 45) % 360
-            rgb = colorsys.hsv_to_rgb(hue / 360, 0.85, 1.0)
-            color = tuple(int(c * 255) for c in rgb)
+            hue = (now * 30 + i * 45) % 360
+            glow, cs = self._get_title_glyph(ch, int(hue) // self.TITLE_HUE_STEP)
             cy = WINDOW_HEIGHT // 5 + int(4 * math.sin(self.title_pulse + i * 0.6))
             cx = start_x + i * cw
 
             # Dark shadow for depth
-            shadow = self.title_font.render(ch, True, (0, 0, 0))
+            shadow = self._title_shadows.get(ch)
+            if shadow is None:
+                shadow = self._title_shadows[ch] = self.title_font.render(ch, True, (0, 0, 0))
             self.screen.blit(shadow, (cx + 3, cy + 3))
 
             # Subtle glow
-            glow_rgb = tuple(min(255, c + 60) for c in color)
-            glow = self.title_font.render(ch, True, glow_rgb)
-            glow.set_alpha(40)
-            for ox, oy in [(1, 1), (-1, -1), (1, -1), (-1, 1)]:
+            for ox, oy in ((1, 1), (-1, -1), (1, -1), (-1, 1)):
                 self.screen.blit(glow, (cx + ox, cy + oy))
 
             # Main letter
-            cs = self.title_font.render(ch, True, color)
             self.screen.blit(cs, (cx, cy))
 
         # Subtitle
@@ -1054,6 +1396,8 @@ class StartMenu:
 class Game:
     """Top-level game controller."""
 
+    TEXT_CACHE_SIZE = 64
+
     def __init__(self, fullscreen=False, disable_music=False):
         self.disable_music = disable_music
 
@@ -1069,15 +1413,21 @@ class Game:
         self.start_menu = StartMenu(self.screen)
         self.clock = pygame.time.Clock()
         self.target_fps = 60
+        # Consecutive failed frames; only the first of a run is reported
+        self._failing_frames = 0
 
         # Game objects
         self.snake: Optional[Snake] = None
         self.food: Optional[Food] = None
         self.powerups: list = []
-        self.particles: list = []
+        self.particles = ParticleSystem()
         self.spirals: list = []
         self.pyramids: list = []
         self.triangles: list = []
+        # Only the first few effects are drawn; keep that subset around
+        self._active_pyramids: list = []
+        self._active_triangles: list = []
+        self._draw_effects = Config.ENABLE_GEOMETRIC_EFFECTS
 
         # State
         self.score = 0
@@ -1112,10 +1462,19 @@ class Game:
         small_font_size = max(24, WINDOW_WIDTH // 60)
         self.font = pygame.font.Font(None, font_size)
         self.small_font = pygame.font.Font(None, small_font_size)
+        self._text_cache: dict = {}
+        self._build_overlays()
 
         # Background
         self.bg_hue = 0.0
-        self.max_particles = Config.MAX_PARTICLES
+        self._bg_column: Optional[pygame.Surface] = None
+        self._static_bg: Optional[pygame.Surface] = None
+        self._static_bg_key = None
+
+        # Dirty-rect rendering (static background only)
+        self._prev_dirty: list = []
+        self._last_frame_key = None
+        self._full_area = self.screen.get_width() * self.screen.get_height()
 
     # ----- lifecycle -----
 
@@ -1126,7 +1485,7 @@ class Game:
         self.snake = Snake(speed_setting)
         self.food = Food()
         self.powerups = []
-        self.particles = []
+        self.particles.clear()
         self.score = 0
         self.game_over = False
         self.paused = False
@@ -1147,13 +1506,15 @@ class Game:
             ]
             self.pyramids = [PyramidEffect(i) for i in range(PYRAMID_COUNT)]
             self.triangles = [TriangleRipper(i) for i in range(TRIANGLE_COUNT)]
+        self._active_pyramids = self.pyramids[:3]
+        self._active_triangles = self.triangles[:3]
 
     def reset_game(self):
         self.game_state = "menu"
         self.snake = None
         self.food = None
         self.powerups = []
-        self.particles = []
+        self.particles.clear()
         self.score = 0
         self.game_over = False
         self.paused = False
@@ -1166,9 +1527,21 @@ class Game:
         if len(self.powerups) < 2 and random.random() < 0.003:
             x = random.randint(0, GRID_WIDTH - 1)
             y = random.randint(0, GRID_HEIGHT - 1)
-            if (x, y) not in self.snake.body and (x, y) != (self.food.x, self.food.y):
+            if not self.snake.occupies((x, y)) and (x, y) != (self.food.x, self.food.y):
                 self.powerups.append(PowerUp(x, y, random.choice(list(PowerUpType))))
 
+    def spawn_particle_burst(self, cx, cy, colors, count=15, lifetime=60):
+        """Spawn a burst of particles, drawing all random values in one batch."""
+        if HAS_NUMPY:
+            velocities = np.random.uniform(-4, 4, (count, 2))
+            sizes = np.random.randint(2, 7, count).tolist()
+            picks = np.random.randint(0, len(colors), count).tolist()
+        else:
+            velocities = [(random.uniform(-4, 4), random.uniform(-4, 4)) for _ in range(count)]
+            sizes = [random.randint(2, 6) for _ in range(count)]
+            picks = [random.randrange(len(colors)) for _ in range(count)]
+        self.particles.emit([(cx, cy)] * count, velocities, [colors[c] for c in picks], sizes, lifetime)
+
     # ----- collision -----
 
     def check_food_collision(self):
@@ -1178,16 +1551,11 @@ class Game:
         if head == (self.food.x, self.food.y):
             self.snake.eat_food()
             self.score += 10 * self.snake.score_multiplier
-            for _ in range(15):
-                vel = (random.uniform(-4, 4), random.uniform(-4, 4))
-                c = random.choice([(220, 20, 60), (255, 0, 0), (255, 69, 0)])
-                self.particles.append(
-                    Particle(
-                        self.food.x * GRID_SIZE + GRID_SIZE // 2,
-                        self.food.y * GRID_SIZE + GRID_SIZE // 2,
-                        c, vel,
-                    )
-                )
+            self.spawn_particle_burst(
+                self.food.x * GRID_SIZE + GRID_SIZE // 2,
+                self.food.y * GRID_SIZE + GRID_SIZE // 2,
+                FOOD_PARTICLE_COLORS,
+            )
             self.food = Food()
             return True
         return False
@@ -1196,112 +1564,150 @@ class Game:
         if self.game_state != "playing" or not self.snake:
             return
         head = self.snake.body[0]
-        for pu in self.powerups[:]:
-            if head == (pu.x, pu.y):
+        remaining = []
+        for pu in self.powerups:
+            if head != (pu.x, pu.y):
+                remaining.append(pu)
+            else:
                 self.snake.eat_powerup(pu)
-                pcolors = {
-                    PowerUpType.SPEED_BOOST: NEON_BLUE,
-                    PowerUpType.SCORE_MULTIPLIER: NEON_YELLOW,
-                    PowerUpType.RAINBOW_MODE: NEON_PURPLE,
-                    PowerUpType.MEGA_FOOD: NEON_ORANGE,
-                }
-                for _ in range(15):
-                    vel = (random.uniform(-4, 4), random.uniform(-4, 4))
-                    self.particles.append(
-                        Particle(
-                            pu.x * GRID_SIZE + GRID_SIZE // 2,
-                            pu.y * GRID_SIZE + GRID_SIZE // 2,
-                            pcolors[pu.type], vel, 120,
-                        )
-                    )
-                self.powerups.remove(pu)
+                self.spawn_particle_burst(
+                    pu.x * GRID_SIZE + GRID_SIZE // 2,
+                    pu.y * GRID_SIZE + GRID_SIZE // 2,
+                    (POWERUP_COLORS[pu.type],), lifetime=120,
+                )
+        self.powerups = remaining
 
     # ----- drawing helpers -----
 
     def draw_rainbow_background(self):
+        if not Config.ANIMATED_BACKGROUND:
+            self.screen.blit(self._get_static_background(), (0, 0))
+            return
         self.bg_hue = (self.bg_hue + 0.3) % 360
-        sw = self.screen.get_width()
-        sh = self.screen.get_height()
+        self._paint_background(self.screen)
+
+    def _get_static_background(self):
+        """Return the pre-rendered static background (with grid when enabled)."""
+        key = (self.screen.get_size(), self.show_grid)
+        if self._static_bg is None or self._static_bg_key != key:
+            self._static_bg = pygame.Surface(self.screen.get_size()).convert(self.screen)
+            self._paint_background(self._static_bg)
+            if self.show_grid:
+                self.draw_grid_overlay(self._static_bg)
+            self._static_bg_key = key
+        return self._static_bg
+
+    def _paint_background(self, surface):
+        sw = surface.get_width()
+        sh = surface.get_height()
+        band_height = 12
+
+        if PIXELATED_BACKGROUND and HAS_NUMPY:
+            # Compute every band colour at once, expand to a one-pixel column
+            # and stretch it across the screen in a single scale call.
+            ys = np.arange(0, sh, band_height)
+            t = ys / sh
+            colors = hsv_to_rgb_array(((self.bg_hue + t * 40) % 360) / 360, 0.2, 0.10 + 0.06 * (1 - t))
+            column = np.repeat(colors, band_height, axis=0)[:sh][None, :, :]
+            if self._bg_column is None or self._bg_column.get_height() != sh:
+                self._bg_column = pygame.Surface((1, sh)).convert(surface)
+            pygame.surfarray.blit_array(self._bg_column, column)
+            pygame.transform.scale(self._bg_column, (sw, sh), surface)
+            return
+
         base_rgb = colorsys.hsv_to_rgb(self.bg_hue / 360, 0.25, 0.12)
-        self.screen.fill(tuple(int(c * 255) for c in base_rgb))
+        surface.fill(tuple(int(c * 255) for c in base_rgb))
 
         if PIXELATED_BACKGROUND:
             # Subtle gradient bands instead of rainbow blocks
-            band_height = 12
             for y in range(0, sh, band_height):
                 t = y / sh
                 hue = (self.bg_hue + t * 40) % 360
                 rgb = colorsys.hsv_to_rgb(hue / 360, 0.2, 0.10 + 0.06 * (1 - t))
                 color = tuple(int(c * 255) for c in rgb)
-                pygame.draw.rect(self.screen, color, (0, y, sw, band_height))
+                pygame.draw.rect(surface, color, (0, y, sw, band_height))
 
-    def draw_grid_overlay(self):
+    def draw_grid_overlay(self, surface=None):
+        surface = surface or self.screen
         for x in range(0, WINDOW_WIDTH, GRID_SIZE):
-            pygame.draw.line(self.screen, DARK_GRAY, (x, 0), (x, WINDOW_HEIGHT), 1)
+            pygame.draw.line(surface, DARK_GRAY, (x, 0), (x, WINDOW_HEIGHT), 1)
         for y in range(0, WINDOW_HEIGHT, GRID_SIZE):
-            pygame.draw.line(self.screen, DARK_GRAY, (0, y), (WINDOW_WIDTH, y), 1)
+            pygame.draw.line(surface, DARK_GRAY, (0, y), (WINDOW_WIDTH, y), 1)
+
+    def _render_cached(self, font, text, color):
+        """Render text through a small FIFO cache keyed by (font, text, color)."""
+        key = (id(font), text, color)
+        surf = self._text_cache.get(key)
+        if surf is None:
+            if len(self._text_cache) >= self.TEXT_CACHE_SIZE:
+                del self._text_cache[next(iter(self._text_cache))]
+            surf = self._text_cache[key] = to_display_format(font.render(text, True, color))
+        return surf
 
     def draw_ui(self):
+        """Draw the HUD and return the list of screen rects it touched."""
         if self.game_state != "playing" or not self.snake:
-            return
-        self.screen.blit(self.font.render(f"Score: {self.score}", True, WHITE), (10, 10))
-        self.screen.blit(self.font.render(f"Length: {len(self.snake.body)}", True, WHITE), (10, 50))
-        self.screen.blit(self.font.render(f"Speed: {int(self.snake.get_current_speed())}", True, WHITE), (10, 90))
+            return []
+        blit = self.screen.blit
+        render = self._render_cached
+        rects = [
+            blit(render(self.font, f"Score: {self.score}", WHITE), (10, 10)),
+            blit(render(self.font, f"Length: {len(self.snake.body)}", WHITE), (10, 50)),
+            blit(render(self.font, f"Speed: {int(self.snake.get_current_speed())}", WHITE), (10, 90)),
+        ]
 
         best = self.high_scores.get_best(self.speed_name)
         if best > 0:
-            self.screen.blit(self.small_font.render(f"Best: {best}", True, NEON_YELLOW), (10, 130))
+            rects.append(blit(render(self.small_font, f"Best: {best}", NEON_YELLOW), (10, 130)))
 
         if self.current_song_name:
-            self.screen.blit(self.small_font.render(self.current_song_name, True, NEON_PINK), (10, WINDOW_HEIGHT - 30))
+            rects.append(blit(render(self.small_font, self.current_song_name, NEON_PINK), (10, WINDOW_HEIGHT - 30)))
 
         y_off = 160
         if self.snake.speed_boost_timer > 0:
-            self.screen.blit(self.small_font.render("SPEED BOOST!", True, NEON_BLUE), (10, y_off))
+            rects.append(blit(render(self.small_font, "SPEED BOOST!", NEON_BLUE), (10, y_off)))
             y_off += 25
         if self.snake.score_multiplier > 1:
-            self.screen.blit(self.small_font.render(f"{self.snake.score_multiplier}x SCORE!", True, NEON_YELLOW), (10, y_off))
+            rects.append(blit(render(self.small_font, f"{self.snake.score_multiplier}x SCORE!", NEON_YELLOW), (10, y_off)))
             y_off += 25
         if self.snake.rainbow_mode:
-            self.screen.blit(self.small_font.render("RAINBOW MODE!", True, NEON_PURPLE), (10, y_off))
+            rects.append(blit(render(self.small_font, "RAINBOW MODE!", NEON_PURPLE), (10, y_off)))
+        return rects
 
     def draw_fps_counter(self):
         fps = int(self.clock.get_fps())
-        self.screen.blit(self.small_font.render(f"FPS: {fps}", True, NEON_GREEN), (WINDOW_WIDTH - 120, 10))
+        return self.screen.blit(self._render_cached(self.small_font, f"FPS: {fps}", NEON_GREEN), (WINDOW_WIDTH - 120, 10))
+
+    def _build_overlays(self):
+        """Create the dim layer shared by the pause and game-over screens."""
+        self._dim_overlay = to_display_format(pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT)))
+        self._dim_overlay.fill(BLACK)
+
+    def _blit_centered(self, surf, dy):
+        self.screen.blit(surf, surf.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 + dy)))
 
     def draw_pause_screen(self):
-        overlay = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
-        overlay.set_alpha(150)
-        overlay.fill(BLACK)
-        self.screen.blit(overlay, (0, 0))
-        pt = self.font.render("PAUSED", True, NEON_BLUE)
-        ct = self.small_font.render("Press SPACE to continue", True, WHITE)
-        self.screen.blit(pt, pt.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 - 30)))
-        self.screen.blit(ct, ct.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 + 50)))
+        self._dim_overlay.set_alpha(150)
+        self.screen.blit(self._dim_overlay, (0, 0))
+        self._blit_centered(self._render_cached(self.font, "PAUSED", NEON_BLUE), -30)
+        self._blit_centered(self._render_cached(self.small_font, "Press SPACE to continue", WHITE), 50)
 
     def draw_game_over_screen(self):
         if self._death_timer < 20:
             self._death_timer += 1
             self._screen_shake = max(0.0, (20 - self._death_timer) * 0.5)
 
-        overlay = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
-        overlay.set_alpha(200)
-        overlay.fill(BLACK)
-        self.screen.blit(overlay, (0, 0))
+        self._dim_overlay.set_alpha(200)
+        self.screen.blit(self._dim_overlay, (0, 0))
+        self._blit_centered(self._render_cached(self.font, "GAME OVER", NEON_PINK), -100)
+        self._blit_centered(self._render_cached(self.font, f"Final Score: {self.score}", WHITE), -30)
 
-        go = self.font.render("GAME OVER", True, NEON_PINK)
-        sc = self.font.render(f"Final Score: {self.score}", True, WHITE)
         best = self.high_scores.get_best(self.speed_name)
-        if self.score >= best and self.score > 0:
-            bl = self.small_font.render("NEW HIGH SCORE!", True, NEON_YELLOW)
-        else:
-            bl = self.small_font.render(f"Best: {best}", True, NEON_YELLOW)
-        rt = self.small_font.render("Press R to return to menu  |  ESC to quit", True, WHITE)
-
-        self.screen.blit(go, go.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 - 100)))
-        self.screen.blit(sc, sc.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 - 30)))
-        self.screen.blit(bl, bl.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 + 30)))
-        self.screen.blit(rt, rt.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 + 90)))
+        text = "NEW HIGH SCORE!" if self.score >= best and self.score > 0 else f"Best: {best}"
+        self._blit_centered(self._render_cached(self.small_font, text, NEON_YELLOW), 30)
+        self._blit_centered(
+            self._render_cached(self.small_font, "Press R to return to menu  |  ESC to quit", WHITE), 90
+        )
 
     # ----- event handling -----
 
@@ -1373,7 +1779,6 @@ class Game:
             return
 
         self.snake.update_effects()
-        self.snake.update_move_interval()
         self.snake.move()
 
         if self.snake.check_collision():
@@ -1388,18 +1793,12 @@ class Game:
         self.food.update()
         self.spawn_powerup()
 
-        for pu in self.powerups[:]:
+        now = time.monotonic()
+        for pu in self.powerups:
             pu.update()
-            if pu.is_expired():
-                self.powerups.remove(pu)
-
-        for particle in self.particles[:]:
-            particle.update()
-            if particle.lifetime <= 0:
-                self.particles.remove(particle)
+        self.powerups = [pu for pu in self.powerups if not pu.is_expired(now)]
 
-        if len(self.particles) > self.max_particles:
-            self.particles = self.particles[-self.max_particles:]
+        self.particles.update()
 
         if self.music_manager:
             new = self.music_manager.check_music()
@@ -1408,7 +1807,55 @@ class Game:
 
     # ----- draw -----
 
+    def _draw_playfield(self):
+        """Draw food, power-ups, snake, particles and HUD; return the rects touched."""
+        rects = []
+        want_rects = not Config.ANIMATED_BACKGROUND
+        screen = self.screen
+        rects.append(self.food.draw(screen))
+        rects.extend(blit_batch(screen, [pu.sprite() for pu in self.powerups], want_rects))
+        rects.extend(self.snake.draw(screen, self.particles, want_rects))
+        particle_rects = blit_batch(screen, self.particles.blit_sequence(), want_rects)
+        if particle_rects:
+            # One bounding rect for the whole particle cloud
+            rects.append(particle_rects[0].unionall(particle_rects[1:]))
+        rects.extend(self.draw_ui())
+        if self.show_fps:
+            rects.append(self.draw_fps_counter())
+        return rects
+
+    def _draw_dirty(self):
+        """Redraw only what changed since the last frame over the static background.
+
+        Returns the rects to push to the display, or None when they cover so
+        much of the screen that a full flip is cheaper.
+        """
+        background = self._get_static_background()
+        for rect in self._prev_dirty:
+            self.screen.blit(background, rect, rect)
+        drawn = self._draw_playfield()
+        dirty = self._prev_dirty + drawn
+        self._prev_dirty = drawn
+        if sum(r.w * r.h for r in dirty) > self._full_area // 2:
+            return None
+        return dirty
+
     def draw(self):
+        """Render a frame; return the dirty rects to update, or None for a full flip."""
+        frame_key = (self.game_state, self.paused, self.show_grid, self.show_fps)
+        partial = (
+            not Config.ANIMATED_BACKGROUND
+            and not self._draw_effects
+            and frame_key == self._last_frame_key
+            and self.game_state == "playing" and not self.paused
+            and self.snake and self.food
+            and self._screen_shake <= 0.5
+        )
+        self._last_frame_key = frame_key
+        if partial:
+            return self._draw_dirty()
+        self._prev_dirty = []
+
         self.screen.fill(BLACK)
         self.draw_rainbow_background()
 
@@ -1418,51 +1865,33 @@ class Game:
             shake_y = int(random.uniform(-self._screen_shake, self._screen_shake))
             self._screen_shake *= 0.85
 
-        if Config.ENABLE_GEOMETRIC_EFFECTS:
-            try:
-                for pyramid in self.pyramids[:3]:
-                    pyramid.draw(self.screen)
-                for triangle in self.triangles[:3]:
-                    triangle.draw(self.screen)
-            except Exception:
-                pass
+        if self._draw_effects:
+            for pyramid in self._active_pyramids:
+                pyramid.draw(self.screen)
+            for triangle in self._active_triangles:
+                triangle.draw(self.screen)
 
         if self.game_state == "menu":
             self.start_menu.draw()
 
         elif self.game_state == "playing" and self.snake and self.food:
-            if self.show_grid:
+            if self.show_grid and Config.ANIMATED_BACKGROUND:
                 self.draw_grid_overlay()
-            try:
-                self.food.draw(self.screen)
-                for pu in self.powerups:
-                    pu.draw(self.screen)
-                self.snake.draw(self.screen, self.particles)
-                for particle in self.particles:
-                    particle.draw(self.screen)
-            except Exception:
-                pygame.draw.rect(
-                    self.screen, NEON_GREEN,
-                    (self.snake.body[0][0] * GRID_SIZE, self.snake.body[0][1] * GRID_SIZE, GRID_SIZE, GRID_SIZE),
-                )
-                pygame.draw.rect(
-                    self.screen, NEON_PINK,
-                    (self.food.x * GRID_SIZE, self.food.y * GRID_SIZE, GRID_SIZE, GRID_SIZE),
-                )
-            self.draw_ui()
+            self._prev_dirty = self._draw_playfield()
             if self.paused:
                 self.draw_pause_screen()
 
         elif self.game_state == "game_over":
             self.draw_game_over_screen()
 
-        if self.show_fps:
+        if self.show_fps and self.game_state != "playing":
             self.draw_fps_counter()
 
         if shake_x or shake_y:
             shifted = self.screen.copy()
             self.screen.fill(BLACK)
             self.screen.blit(shifted, (shake_x, shake_y))
+        return None
 
     # ----- main loop -----
 
@@ -1493,22 +1922,26 @@ class Game:
         running = True
         try:
             while running:
+                # One frame-level guard; a failed frame keeps the previous
+                # running flag and still presents the display
+                dirty_rects = None
                 try:
                     running = self.handle_events()
-                except Exception:
-                    continue
-                try:
                     self.update()
+                    dirty_rects = self.draw()
                 except Exception:
-                    continue
-                try:
-                    self.draw()
-                except Exception:
-                    self.screen.fill((20, 20, 40))
-                try:
+                    if not self._failing_frames:
+                        print("Frame error:")
+                        traceback.print_exc()
+                    self._failing_frames += 1
+                else:
+                    if self._failing_frames:
+                        print(f"Recovered after {self._failing_frames} failed frames")
+                        self._failing_frames = 0
+                if dirty_rects is None:
                     pygame.display.flip()
-                except Exception:
-                    pass
+                else:
+                    pygame.display.update(dirty_rects)
                 self.clock.tick(self.target_fps)
         except KeyboardInterrupt:
             pass
@@ -1539,6 +1972,8 @@ Examples:
     parser.add_argument("--no-music", action="store_true", help="Disable background music")
     parser.add_argument("--no-effects", action="store_true", help="Disable geometric effects")
     parser.add_argument("--no-particles", action="store_true", help="Disable particle effects")
+    parser.add_argument("--static-background", action="store_true",
+                        help="Disable the animated background (redraws only changed areas)")
     parser.add_argument("--fps", type=int, default=60, help="Target FPS (default: 60)")
     parser.add_argument("--windowed", action="store_true", help="Force windowed mode (default)")
     parser.add_argument("--fullscreen", action="store_true", help="Enable fullscreen mode")
@@ -1549,25 +1984,30 @@ Examples:
     return parser.parse_args()
 
 
+def run_test_mode():
+    """CI/CD smoke test: build core objects and exit with a status code."""
+    print("Starting test mode...")
+    try:
+        test_snake = Snake(4)
+        test_food = Food()
+        test_snake.change_direction(Direction.RIGHT)
+        test_snake._start_new_move()
+        hsm = HighScoreManager()
+        hsm.add_score("TEST", 100, 5)
+        assert hsm.get_best("TEST") == 100
+        print("All tests passed.")
+        sys.exit(0)
+    except Exception as e:
+        print(f"Test failed: {e}")
+        sys.exit(1)
+
+
 def main():
-    args = parse_arguments()
+    # CI/CD test mode short-circuits before argparse is imported or built
+    if "--test-mode" in sys.argv[1:]:
+        run_test_mode()
 
-    # CI/CD test mode
-    if args.test_mode:
-        print("Starting test mode...")
-        try:
-            test_snake = Snake(4)
-            test_food = Food()
-            test_snake.change_direction(Direction.RIGHT)
-            test_snake._start_new_move()
-            hsm = HighScoreManager()
-            hsm.add_score("TEST", 100, 5)
-            assert hsm.get_best("TEST") == 100
-            print("All tests passed.")
-            sys.exit(0)
-        except Exception as e:
-            print(f"Test failed: {e}")
-            sys.exit(1)
+    args = parse_arguments()
 
     # Apply CLI overrides
     if args.fps:
@@ -1580,6 +2020,8 @@ def main():
         Config.ENABLE_GEOMETRIC_EFFECTS = False
     if args.no_particles:
         Config.ENABLE_PARTICLES = False
+    if args.static_background:
+        Config.ANIMATED_BACKGROUND = False
 
     if args.resolution:
         try:
@@ -1601,7 +2043,6 @@ def main():
     except Exception as e:
         print(f"Error: {e}")
         if args.debug:
-            import traceback
             traceback.print_exc()
         sys.exit(1)
 
@@ -13,9 +13,23 @@ __version__ = "2.1.0"
 __author__ = "GHOSTKITTY APPS"
 __license__ = "MIT"
 
-from .game_engine import Game
-from .config_manager import ConfigManager
-from .audio_manager import AudioManager
-from .ui_manager import UIManager
-
 __all__ = ['Game', 'ConfigManager', 'AudioManager', 'UIManager']
+
+# Submodule providing each public name. They are imported on first access so
+# that e.g. config tooling can use snakeium.config_manager without pygame.
+_EXPORTS = {
+    'Game': 'game_engine',
+    'ConfigManager': 'config_manager',
+    'AudioManager': 'audio_manager',
+    'UIManager': 'ui_manager',
+}
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+    value = getattr(import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
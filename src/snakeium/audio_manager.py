@@ -4,11 +4,15 @@ Handles music playback, sound effects, and audio visualization.
 """
 
 import pygame
+import atexit
+import json
 import os
 import random
 import math
 import threading
 import time
+import weakref
+from array import array
 from pathlib import Path
 from typing import List, Optional, Dict, Any
 from enum import Enum
@@ -21,6 +25,17 @@ try:
 except ImportError:
     HAS_MUTAGEN = False
 
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+
+def default_metadata_cache_path() -> Path:
+    """$XDG_CACHE_HOME/snakeium/metadata.json, resolved on use rather than at import."""
+    return Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "snakeium" / "metadata.json"
+
 
 class AudioEvent(Enum):
     FOOD_EATEN = "food_eaten"
@@ -36,27 +51,41 @@ class AudioEvent(Enum):
 class MusicManager:
     """Enhanced music management with metadata support."""
     
-    def __init__(self, music_folders: List[str] = None, shuffle: bool = True):
+    def __init__(self, music_folders: List[str] = None, shuffle: bool = True,
+                 metadata_cache_path: Optional[str] = None):
         self.music_folders = music_folders or []
         self.shuffle = shuffle
         self.music_files = []
         self.current_index = 0
+        self._shuffle_bag: List[int] = []
         self.current_song = None
         self.is_playing = False
         self.volume = 0.7
         self.fade_duration = 1000  # milliseconds
+        self._fade_until = 0.0
+        self._pending_next = False
         
-        # Metadata cache
+        # Metadata cache (in memory, plus the on-disk cache loaded by the scan
+        # thread); the disk cache is keyed by path and validated by mtime/size
+        self.metadata_cache_path = Path(metadata_cache_path) if metadata_cache_path else None
         self.metadata_cache = {}
+        self._disk_cache: Dict[str, Dict[str, Any]] = {}
+        self._disk_cache_dirty = False
+        if HAS_MUTAGEN:
+            # Held weakly so the exit hook doesn't keep a discarded manager alive
+            atexit.register(self._save_at_exit, weakref.ref(self))
         
         # Auto-detect music folders if none provided
         if not self.music_folders:
             self._auto_detect_music_folders()
         
-        self._scan_music_files()
-        
-        if self.shuffle and self.music_files:
-            random.shuffle(self.music_files)
+        # Walk the folders off the main thread so the window appears immediately
+        self._play_when_ready = False
+        self._scan_done = threading.Event()
+        self._scan_thread = threading.Thread(
+            target=self._scan_in_background, name="snakeium-music-scan", daemon=True
+        )
+        self._scan_thread.start()
     
     def _auto_detect_music_folders(self):
         """Auto-detect common music folder locations."""
@@ -73,9 +102,19 @@ class MusicManager:
                 self.music_folders.append(folder)
                 print(f"Found music folder: {folder}")
     
+    def _scan_in_background(self):
+        """Scan thread entry point; always signals completion."""
+        try:
+            if HAS_MUTAGEN:
+                self._load_metadata_cache()
+            self._scan_music_files()
+        finally:
+            self._scan_done.set()
+    
     def _scan_music_files(self):
         """Scan for music files in specified folders."""
-        supported_formats = ['.mp3', '.ogg', '.wav']
+        supported_formats = ('.mp3', '.ogg', '.wav')
+        found = []
         
         for folder in self.music_folders:
             if not os.path.exists(folder):
@@ -83,11 +122,50 @@ class MusicManager:
                 
             for root, dirs, files in os.walk(folder):
                 for file in files:
-                    if any(file.lower().endswith(fmt) for fmt in supported_formats):
-                        full_path = os.path.join(root, file)
-                        self.music_files.append(full_path)
+                    if file.lower().endswith(supported_formats):
+                        found.append(os.path.join(root, file))
         
-        print(f"Found {len(self.music_files)} music files")
+        if self.shuffle:
+            random.shuffle(found)
+        # Publish the finished list in one assignment
+        self.music_files = found
+        print(f"Found {len(found)} music files")
+    
+    def wait_for_scan(self, timeout: Optional[float] = None) -> bool:
+        """Block until the background scan finishes; returns True when done."""
+        self._scan_thread.join(timeout)
+        return self._scan_done.is_set()
+    
+    def _load_metadata_cache(self):
+        """Load tag metadata saved by a previous run."""
+        try:
+            with open(self.metadata_cache_path or default_metadata_cache_path(),
+                      "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if isinstance(data, dict):
+                self._disk_cache = data
+        except (OSError, ValueError, RuntimeError):
+            # RuntimeError: Path.home() could not be resolved
+            pass
+    
+    def save_metadata_cache(self):
+        """Write newly read tag metadata back to the on-disk cache."""
+        if not self._disk_cache_dirty:
+            return
+        try:
+            path = self.metadata_cache_path or default_metadata_cache_path()
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(self._disk_cache, f, ensure_ascii=False)
+            self._disk_cache_dirty = False
+        except (OSError, RuntimeError) as e:
+            print(f"Warning: Could not save music metadata cache: {e}")
+    
+    @staticmethod
+    def _save_at_exit(ref):
+        manager = ref()
+        if manager is not None:
+            manager.save_metadata_cache()
     
     def get_metadata(self, file_path: str) -> Dict[str, str]:
         """Get metadata for a music file."""
@@ -97,7 +175,14 @@ class MusicManager:
         if file_path in self.metadata_cache:
             return self.metadata_cache[file_path]
         
+        st = None
         try:
+            st = os.stat(file_path)
+            entry = self._disk_cache.get(file_path)
+            if entry and entry.get("mtime") == st.st_mtime and entry.get("size") == st.st_size:
+                self.metadata_cache[file_path] = entry["meta"]
+                return entry["meta"]
+            
             audio_file = mutagen.File(file_path)
             if audio_file is None:
                 metadata = {"title": os.path.basename(file_path), "artist": "Unknown", "album": "Unknown"}
@@ -110,28 +195,50 @@ class MusicManager:
                 }
             
             self.metadata_cache[file_path] = metadata
+            self._remember_metadata(file_path, st, metadata)
             return metadata
             
         except Exception as e:
             print(f"Warning: Error reading metadata for {file_path}: {e}")
             metadata = {"title": os.path.basename(file_path), "artist": "Unknown", "album": "Unknown"}
             self.metadata_cache[file_path] = metadata
+            if st is not None:
+                self._remember_metadata(file_path, st, metadata)
             return metadata
     
+    def _remember_metadata(self, file_path: str, st: os.stat_result, metadata: Dict[str, Any]):
+        """Record metadata for the on-disk cache, keyed by the file's mtime and size."""
+        self._disk_cache[file_path] = {"mtime": st.st_mtime, "size": st.st_size, "meta": metadata}
+        self._disk_cache_dirty = True
+    
     def play_next(self) -> Optional[str]:
         """Play the next song in the playlist."""
+        if not self._scan_done.is_set() and not self.wait_for_scan(0.05):
+            # Start playback from check_music once the scan completes
+            self._play_when_ready = True
+            return None
+        
         if not self.music_files:
             return None
         
+        # Fade out the current song without blocking; check_music starts the
+        # next track once the fade has finished.
+        if self.is_playing and pygame.mixer.music.get_busy():
+            pygame.mixer.music.fadeout(self.fade_duration)
+            self._fade_until = time.monotonic() + self.fade_duration / 1000.0
+            self._pending_next = True
+            return None
+        
+        return self._start_next_track()
+    
+    def _start_next_track(self) -> Optional[str]:
+        """Load and start the next track immediately."""
         try:
-            # Fade out current song
-            if self.is_playing:
-                pygame.mixer.music.fadeout(self.fade_duration)
-                time.sleep(self.fade_duration / 1000.0)
-            
             # Get next song
             if self.shuffle:
-                song_path = random.choice(self.music_files)
+                if not self._shuffle_bag:
+                    self._refill_shuffle_bag()
+                song_path = self.music_files[self._shuffle_bag.pop()]
             else:
                 song_path = self.music_files[self.current_index]
                 self.current_index = (self.current_index + 1) % len(self.music_files)
@@ -150,6 +257,14 @@ class MusicManager:
             print(f"Warning: Error playing music: {e}")
             return None
     
+    def _refill_shuffle_bag(self):
+        """Queue every track once in random order, never repeating the last one first."""
+        bag = list(range(len(self.music_files)))
+        random.shuffle(bag)
+        if len(bag) > 1 and self.current_song == self.music_files[bag[-1]]:
+            bag[0], bag[-1] = bag[-1], bag[0]
+        self._shuffle_bag = bag
+    
     def set_volume(self, volume: float):
         """Set music volume (0.0 - 1.0)."""
         self.volume = max(0.0, min(1.0, volume))
@@ -169,9 +284,18 @@ class MusicManager:
         """Stop music playback."""
         pygame.mixer.music.stop()
         self.is_playing = False
+        self._pending_next = False
     
     def check_music(self) -> Optional[str]:
         """Check if current song has ended and play next."""
+        if self._pending_next:
+            if time.monotonic() < self._fade_until:
+                return None
+            self._pending_next = False
+            return self._start_next_track()
+        if self._play_when_ready and self._scan_done.is_set():
+            self._play_when_ready = False
+            return self.play_next()
         if not pygame.mixer.music.get_busy() and self.is_playing:
             return self.play_next()
         return None
@@ -188,8 +312,8 @@ class SoundEffectManager:
     def _generate_sound_effects(self):
         """Generate procedural sound effects."""
         try:
-            # Generate sound effects using pygame
-            sample_rate = 22050
+            # Generate at the mixer's actual rate so durations and pitch hold
+            sample_rate = (pygame.mixer.get_init() or (22050,))[0]
             
             # Food eaten sound (positive chirp)
             self.sounds[AudioEvent.FOOD_EATEN] = self._generate_chirp(440, 0.1, sample_rate)
@@ -213,65 +337,63 @@ class SoundEffectManager:
         except Exception as e:
             print(f"Warning: Error generating sound effects: {e}")
     
+    def _synth(self, frames: int, sample_rate: int, freq, amp):
+        """Render amp(t) * sin(2*pi*freq(t)*i/sample_rate) for i in range(frames), t = i/frames."""
+        if HAS_NUMPY:
+            i = np.arange(frames, dtype=np.float64)
+            t = i / frames
+            return amp(t) * np.sin(2 * np.pi * freq(t) * i / sample_rate)
+        return [amp(i / frames) * math.sin(2 * math.pi * freq(i / frames) * i / sample_rate)
+                for i in range(frames)]
+    
+    def _make_sound(self, wave) -> pygame.mixer.Sound:
+        """Convert a mono waveform in [-1, 1] to a 16-bit Sound matching the mixer channels."""
+        channels = (pygame.mixer.get_init() or (0, 0, 2))[2]
+        if HAS_NUMPY:
+            samples = (np.asarray(wave) * 32767).astype(np.int16)
+            if channels > 1:
+                samples = np.ascontiguousarray(np.repeat(samples[:, None], channels, axis=1))
+            return pygame.sndarray.make_sound(samples)
+        samples = array('h', [int(s * 32767) for s in wave for _ in range(channels)])
+        return pygame.mixer.Sound(buffer=samples)
+    
     def _generate_chirp(self, frequency: float, duration: float, sample_rate: int) -> pygame.mixer.Sound:
         """Generate a chirp sound effect."""
         frames = int(duration * sample_rate)
-        arr = []
-        
-        for i in range(frames):
-            # Frequency sweep
-            freq = frequency * (1 + 0.5 * (i / frames))
-            # Amplitude envelope
-            amplitude = 0.3 * (1 - i / frames)
-            # Generate sample
-            sample = int(amplitude * 32767 * math.sin(2 * math.pi * freq * i / sample_rate))
-            arr.append([sample, sample])
-        
-        sound = pygame.sndarray.make_sound(pygame.array.array('i', [item for sublist in arr for item in sublist]))
-        return sound
+        # Frequency sweep with a linear amplitude envelope
+        wave = self._synth(frames, sample_rate,
+                           freq=lambda t: frequency * (1 + 0.5 * t),
+                           amp=lambda t: 0.3 * (1 - t))
+        return self._make_sound(wave)
     
     def _generate_arpeggio(self, frequencies: List[float], duration: float, sample_rate: int) -> pygame.mixer.Sound:
         """Generate an arpeggio sound effect."""
         note_duration = duration / len(frequencies)
         frames_per_note = int(note_duration * sample_rate)
-        arr = []
-        
-        for freq in frequencies:
-            for i in range(frames_per_note):
-                amplitude = 0.3 * (1 - (i / frames_per_note) * 0.5)
-                sample = int(amplitude * 32767 * math.sin(2 * math.pi * freq * i / sample_rate))
-                arr.append([sample, sample])
-        
-        sound = pygame.sndarray.make_sound(pygame.array.array('i', [item for sublist in arr for item in sublist]))
-        return sound
+        notes = [
+            self._synth(frames_per_note, sample_rate,
+                        freq=lambda t, f=freq: f,
+                        amp=lambda t: 0.3 * (1 - t * 0.5))
+            for freq in frequencies
+        ]
+        wave = np.concatenate(notes) if HAS_NUMPY else [s for note in notes for s in note]
+        return self._make_sound(wave)
     
     def _generate_descending_tone(self, duration: float, sample_rate: int) -> pygame.mixer.Sound:
         """Generate a descending tone for game over."""
         frames = int(duration * sample_rate)
-        arr = []
-        
-        for i in range(frames):
-            # Descending frequency
-            freq = 440 * (1 - 0.7 * (i / frames))
-            amplitude = 0.4 * (1 - i / frames)
-            sample = int(amplitude * 32767 * math.sin(2 * math.pi * freq * i / sample_rate))
-            arr.append([sample, sample])
-        
-        sound = pygame.sndarray.make_sound(pygame.array.array('i', [item for sublist in arr for item in sublist]))
-        return sound
+        wave = self._synth(frames, sample_rate,
+                           freq=lambda t: 440 * (1 - 0.7 * t),
+                           amp=lambda t: 0.4 * (1 - t))
+        return self._make_sound(wave)
     
     def _generate_beep(self, frequency: float, duration: float, sample_rate: int) -> pygame.mixer.Sound:
         """Generate a simple beep."""
         frames = int(duration * sample_rate)
-        arr = []
-        
-        for i in range(frames):
-            amplitude = 0.3 * (1 - i / frames)
-            sample = int(amplitude * 32767 * math.sin(2 * math.pi * frequency * i / sample_rate))
-            arr.append([sample, sample])
-        
-        sound = pygame.sndarray.make_sound(pygame.array.array('i', [item for sublist in arr for item in sublist]))
-        return sound
+        wave = self._synth(frames, sample_rate,
+                           freq=lambda t: frequency,
+                           amp=lambda t: 0.3 * (1 - t))
+        return self._make_sound(wave)
     
     def _generate_pause_sound(self, sample_rate: int) -> pygame.mixer.Sound:
         """Generate pause sound (two quick beeps)."""
@@ -299,23 +421,41 @@ class SoundEffectManager:
         self.volume = max(0.0, min(1.0, volume))
 
 
+class NullSoundEffectManager:
+    """Stand-in for SoundEffectManager when audio output is unavailable."""
+    
+    def play_sound(self, event: AudioEvent):
+        pass
+    
+    def set_volume(self, volume: float):
+        pass
+
+
 class AudioManager:
     """Main audio manager that coordinates music and sound effects."""
     
     def __init__(self, config_manager=None):
         self.config = config_manager
+        self.music_manager = None
+        self.sfx_manager = NullSoundEffectManager()
         
-        # Initialize audio systems
-        try:
-            pygame.mixer.pre_init(frequency=22050, size=-16, channels=2, buffer=512)
-            pygame.mixer.init()
-            print("Audio system initialized")
-        except Exception as e:
-            print(f"Failed to initialize audio: {e}")
+        # Nothing will ever be heard, so don't open the audio device at all
+        if config_manager and not (config_manager.audio.music_enabled or
+                                   config_manager.audio.sound_effects_enabled):
+            print("Audio disabled")
             return
         
+        # Initialize audio systems, reusing a mixer someone else already opened
+        if not pygame.mixer.get_init():
+            try:
+                pygame.mixer.pre_init(frequency=22050, size=-16, channels=2, buffer=512)
+                pygame.mixer.init()
+                print("Audio system initialized")
+            except Exception as e:
+                print(f"Failed to initialize audio: {e}")
+                return
+        
         # Initialize managers
-        self.music_manager = None
         self.sfx_manager = SoundEffectManager()
         
         # Get settings from config
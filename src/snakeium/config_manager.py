@@ -3,14 +3,33 @@ Configuration Manager for SNAKEIUM
 Handles all game settings, user preferences, and configuration persistence.
 """
 
+import atexit
+import copy
+import functools
+import heapq
 import json
+import logging
+import operator
 import os
-import pygame
+import sys
+import threading
+import time
+import weakref
 from pathlib import Path
-from typing import Dict, Any, Tuple, List
-from dataclasses import dataclass, asdict
+from types import MappingProxyType
+from typing import Dict, Any, Tuple, List, Mapping
+from dataclasses import dataclass
 from enum import Enum
 
+log = logging.getLogger(__name__)
+
+# Optional fast JSON codec; the stdlib json module is used when it is missing
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 
 class GameMode(Enum):
     CLASSIC = "classic"
@@ -28,8 +47,89 @@ class Theme(Enum):
     CUSTOM = "custom"
 
 
-@dataclass
-class DisplaySettings:
+# Enum members and values resolved once; Theme(value) and .value go through
+# the Enum machinery on every call
+_THEME_CUSTOM = Theme.CUSTOM
+_THEME_VALUES = {theme: theme.value for theme in Theme}
+_THEMES_BY_VALUE = {value: theme for theme, value in _THEME_VALUES.items()}
+
+
+# Built-in color schemes, shared read-only by every ConfigManager
+THEME_COLORS: Mapping[Theme, Mapping[str, Tuple[int, int, int]]] = MappingProxyType({
+    Theme.GHOSTKITTY: MappingProxyType({
+        'background': (0, 0, 0),
+        'snake': (0, 255, 0),
+        'food': (255, 0, 0),
+        'ui_text': (255, 255, 255),
+        'neon_blue': (0, 191, 255),
+        'neon_pink': (255, 20, 147),
+        'neon_green': (50, 205, 50),
+        'neon_yellow': (255, 255, 0),
+        'neon_purple': (138, 43, 226),
+        'neon_orange': (255, 140, 0)
+    }),
+    Theme.NEON: MappingProxyType({
+        'background': (10, 10, 30),
+        'snake': (0, 255, 255),
+        'food': (255, 0, 255),
+        'ui_text': (255, 255, 255),
+        'neon_blue': (0, 255, 255),
+        'neon_pink': (255, 0, 255),
+        'neon_green': (0, 255, 0),
+        'neon_yellow': (255, 255, 0),
+        'neon_purple': (128, 0, 255),
+        'neon_orange': (255, 128, 0)
+    }),
+    Theme.RETRO: MappingProxyType({
+        'background': (64, 128, 64),
+        'snake': (255, 255, 255),
+        'food': (255, 255, 0),
+        'ui_text': (255, 255, 255),
+        'neon_blue': (128, 128, 255),
+        'neon_pink': (255, 128, 128),
+        'neon_green': (128, 255, 128),
+        'neon_yellow': (255, 255, 128),
+        'neon_purple': (255, 128, 255),
+        'neon_orange': (255, 192, 128)
+    }),
+    Theme.MINIMAL: MappingProxyType({
+        'background': (32, 32, 32),
+        'snake': (200, 200, 200),
+        'food': (150, 150, 150),
+        'ui_text': (255, 255, 255),
+        'neon_blue': (100, 100, 150),
+        'neon_pink': (150, 100, 150),
+        'neon_green': (100, 150, 100),
+        'neon_yellow': (150, 150, 100),
+        'neon_purple': (128, 100, 150),
+        'neon_orange': (150, 125, 100)
+    })
+})
+_DEFAULT_THEME_COLORS = THEME_COLORS[Theme.GHOSTKITTY]
+
+
+# Settings dataclasses use __slots__ where dataclass supports it (Python 3.10+)
+_SETTINGS_DATACLASS = dataclass(slots=True) if sys.version_info >= (3, 10) else dataclass
+
+
+class _Settings:
+    """Shared helpers for the settings dataclasses."""
+    
+    __slots__ = ()
+    
+    @classmethod
+    def from_mapping(cls, data: Dict[str, Any]):
+        """Build from a loaded config section, ignoring keys this version doesn't know."""
+        fields = cls.__dataclass_fields__
+        return cls(**{name: value for name, value in data.items() if name in fields})
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Shallow field-by-field copy; works with or without __slots__."""
+        return {name: getattr(self, name) for name in self.__dataclass_fields__}
+
+
+@_SETTINGS_DATACLASS
+class DisplaySettings(_Settings):
     width: int = 1400
     height: int = 900
     fullscreen: bool = False
@@ -38,18 +138,19 @@ class DisplaySettings:
     show_fps: bool = False
 
 
-@dataclass
-class GameplaySettings:
+@_SETTINGS_DATACLASS
+class GameplaySettings(_Settings):
     default_speed: int = 4
     wrap_around: bool = True
     power_ups_enabled: bool = True
     particle_effects: bool = True
     visual_effects: bool = True
     max_particles: int = 300
+    threaded_particles: bool = False
 
 
-@dataclass
-class AudioSettings:
+@_SETTINGS_DATACLASS
+class AudioSettings(_Settings):
     music_enabled: bool = True
     sound_effects_enabled: bool = True
     music_volume: float = 0.7
@@ -58,30 +159,40 @@ class AudioSettings:
     shuffle_music: bool = True
 
 
-@dataclass
-class ControlSettings:
+# pygame 2 (SDL2) keycodes for the default bindings, spelled out so building
+# default settings doesn't import pygame; tests check them against pygame.K_*
+KEY_DEFAULTS = {
+    'K_UP': 0x40000052, 'K_DOWN': 0x40000051, 'K_LEFT': 0x40000050, 'K_RIGHT': 0x4000004F,
+    'K_SPACE': 32, 'K_ESCAPE': 27,
+    'K_a': ord('a'), 'K_d': ord('d'), 'K_m': ord('m'),
+    'K_r': ord('r'), 'K_s': ord('s'), 'K_w': ord('w'),
+}
+
+
+@_SETTINGS_DATACLASS
+class ControlSettings(_Settings):
     up_keys: List[int] = None
     down_keys: List[int] = None
     left_keys: List[int] = None
     right_keys: List[int] = None
-    pause_key: int = pygame.K_SPACE
-    restart_key: int = pygame.K_r
-    menu_key: int = pygame.K_ESCAPE
-    skip_music_key: int = pygame.K_m
+    pause_key: int = KEY_DEFAULTS['K_SPACE']
+    restart_key: int = KEY_DEFAULTS['K_r']
+    menu_key: int = KEY_DEFAULTS['K_ESCAPE']
+    skip_music_key: int = KEY_DEFAULTS['K_m']
     
     def __post_init__(self):
         if self.up_keys is None:
-            self.up_keys = [pygame.K_UP, pygame.K_w]
+            self.up_keys = [KEY_DEFAULTS['K_UP'], KEY_DEFAULTS['K_w']]
         if self.down_keys is None:
-            self.down_keys = [pygame.K_DOWN, pygame.K_s]
+            self.down_keys = [KEY_DEFAULTS['K_DOWN'], KEY_DEFAULTS['K_s']]
         if self.left_keys is None:
-            self.left_keys = [pygame.K_LEFT, pygame.K_a]
+            self.left_keys = [KEY_DEFAULTS['K_LEFT'], KEY_DEFAULTS['K_a']]
         if self.right_keys is None:
-            self.right_keys = [pygame.K_RIGHT, pygame.K_d]
+            self.right_keys = [KEY_DEFAULTS['K_RIGHT'], KEY_DEFAULTS['K_d']]
 
 
-@dataclass
-class ThemeSettings:
+@_SETTINGS_DATACLASS
+class ThemeSettings(_Settings):
     current_theme: Theme = Theme.GHOSTKITTY
     custom_colors: Dict[str, Tuple[int, int, int]] = None
     rainbow_background: bool = True
@@ -92,8 +203,8 @@ class ThemeSettings:
             self.custom_colors = {}
 
 
-@dataclass
-class DeveloperSettings:
+@_SETTINGS_DATACLASS
+class DeveloperSettings(_Settings):
     debug_mode: bool = False
     show_collision_boxes: bool = False
     performance_monitor: bool = False
@@ -103,10 +214,33 @@ class DeveloperSettings:
 class ConfigManager:
     """Manages all game configuration and settings."""
     
-    DEFAULT_CONFIG_PATH = Path.home() / ".snakeium" / "config.json"
+    # Settings sections and their fields addressable by get()/set() dot notation.
+    # Sections are looked up on self each time because load_config and
+    # reset_to_defaults replace them.
+    _SECTION_FIELDS = {
+        'display': frozenset(DisplaySettings.__dataclass_fields__),
+        'gameplay': frozenset(GameplaySettings.__dataclass_fields__),
+        'audio': frozenset(AudioSettings.__dataclass_fields__),
+        'controls': frozenset(ControlSettings.__dataclass_fields__),
+        'theme': frozenset(ThemeSettings.__dataclass_fields__),
+        'developer': frozenset(DeveloperSettings.__dataclass_fields__),
+    }
+    _APP_INFO = {'app.version': "2.1.0", 'app.name': "SNAKEIUM"}
+    
+    HIGH_SCORE_LIMIT = 10
+    
+    # How update_statistics combines a new value into each counter; keys not
+    # listed here are simply overwritten
+    _STAT_UPDATES = {
+        'total_playtime': operator.add,
+        'total_games': lambda total, _: total + 1,
+        'longest_snake': operator.add,
+        'power_ups_collected': operator.add,
+    }
+    SAVE_DEBOUNCE = 0.5  # seconds to coalesce repeated save_config calls
     
     def __init__(self, config_path: str = None):
-        self.config_path = Path(config_path) if config_path else self.DEFAULT_CONFIG_PATH
+        self.config_path = Path(config_path) if config_path else self.default_config_path()
         
         # Initialize default settings
         self.display = DisplaySettings()
@@ -116,6 +250,13 @@ class ConfigManager:
         self.theme = ThemeSettings()
         self.developer = DeveloperSettings()
         
+        # Bumped whenever settings are loaded, reset or changed through set(), so
+        # callers can cache values derived from them (theme colors, fonts, ...)
+        self.settings_version = 0
+        
+        # pygame display flags per (fullscreen, vsync) combination
+        self._display_flags: Dict[Tuple[bool, bool], int] = {}
+        
         # High scores and statistics
         self.high_scores = {}
         self.statistics = {
@@ -128,75 +269,202 @@ class ConfigManager:
             "achievements": []
         }
         
+        # Debounced background saving; the writer thread starts on first save
+        self._save_lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._save_requested = threading.Event()
+        self._pending_snapshot = None
+        self._save_thread = None
+        self._last_saved_hash = None
+        # Held weakly so the exit hook doesn't keep a discarded manager alive
+        atexit.register(self._flush_at_exit, weakref.ref(self))
+        
         # Load existing configuration
         self.load_config()
     
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def default_config_path() -> Path:
+        """~/.snakeium/config.json, resolved on first use rather than at import."""
+        return Path.home() / ".snakeium" / "config.json"
+    
     def load_config(self) -> bool:
         """Load configuration from file."""
+        # Open directly rather than checking exists() first: one syscall, no race
         try:
-            if self.config_path.exists():
-                with open(self.config_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                
-                # Load each section
-                if 'display' in data:
-                    self.display = DisplaySettings(**data['display'])
-                if 'gameplay' in data:
-                    self.gameplay = GameplaySettings(**data['gameplay'])
-                if 'audio' in data:
-                    self.audio = AudioSettings(**data['audio'])
-                if 'controls' in data:
-                    self.controls = ControlSettings(**data['controls'])
-                if 'theme' in data:
-                    theme_data = data['theme'].copy()
-                    if 'current_theme' in theme_data:
-                        theme_data['current_theme'] = Theme(theme_data['current_theme'])
-                    self.theme = ThemeSettings(**theme_data)
-                if 'developer' in data:
-                    self.developer = DeveloperSettings(**data['developer'])
-                if 'high_scores' in data:
-                    self.high_scores = data['high_scores']
-                if 'statistics' in data:
-                    self.statistics.update(data['statistics'])
-                
-                print(f"Configuration loaded from {self.config_path}")
-                return True
-                
-        except Exception as e:
-            print(f"Warning: Failed to load config: {e}")
-            print("Using default configuration")
+            raw = self.config_path.read_bytes()
+        except FileNotFoundError:
+            return False
+        except OSError as e:
+            log.warning("Failed to load config: %s; using default configuration", e)
+            return False
+        
+        try:
+            data = orjson.loads(raw) if HAS_ORJSON else json.loads(raw)
+            
+            # Load each section
+            if 'display' in data:
+                self.display = DisplaySettings.from_mapping(data['display'])
+            if 'gameplay' in data:
+                self.gameplay = GameplaySettings.from_mapping(data['gameplay'])
+            if 'audio' in data:
+                self.audio = AudioSettings.from_mapping(data['audio'])
+            if 'controls' in data:
+                self.controls = ControlSettings.from_mapping(data['controls'])
+            if 'theme' in data:
+                theme_data = data['theme'].copy()
+                if 'current_theme' in theme_data:
+                    value = theme_data['current_theme']
+                    # Fall back to Theme() for unknown values so the error names the enum
+                    theme_data['current_theme'] = _THEMES_BY_VALUE.get(value) or Theme(value)
+                if theme_data.get('custom_colors'):
+                    # Keys parsed from JSON are fresh strings; intern them so
+                    # lookups with the literal color names match by identity
+                    theme_data['custom_colors'] = {
+                        sys.intern(name): color for name, color in theme_data['custom_colors'].items()
+                    }
+                self.theme = ThemeSettings.from_mapping(theme_data)
+            if 'developer' in data:
+                self.developer = DeveloperSettings.from_mapping(data['developer'])
+            if 'high_scores' in data:
+                # Kept in memory as bounded min-heaps, stored on disk best-first.
+                # Trim on the way in so an oversized file can't grow the heaps.
+                limit = self.HIGH_SCORE_LIMIT
+                self.high_scores = {}
+                for mode, scores in data['high_scores'].items():
+                    if len(scores) > limit:
+                        scores = heapq.nlargest(limit, scores)
+                    heapq.heapify(scores)
+                    self.high_scores[mode] = scores
+            if 'statistics' in data:
+                self.statistics.update(data['statistics'])
+            
+            self.settings_version += 1
+            log.info("Configuration loaded from %s", self.config_path)
+            return True
+            
+        except (ValueError, TypeError, KeyError, AttributeError) as e:
+            # Malformed JSON (JSONDecodeError is a ValueError) or sections of the wrong shape
+            log.warning("Failed to load config: %s; using default configuration", e)
         
         return False
     
     def save_config(self) -> bool:
-        """Save configuration to file."""
+        """Schedule a save; rapid calls are coalesced into one background write.
+        
+        Returns True once the save is scheduled, not written; call flush() when
+        the result of the write itself matters.
+        """
+        try:
+            snapshot = self._snapshot()
+        except (KeyError, TypeError) as e:
+            log.error("Failed to save config: %s", e)
+            return False
+        
+        with self._save_lock:
+            self._pending_snapshot = snapshot
+            self._save_requested.set()
+            if self._save_thread is None:
+                self._save_thread = threading.Thread(
+                    target=self._save_worker, args=(weakref.ref(self), self._save_requested),
+                    daemon=True)
+                self._save_thread.start()
+        return True
+    
+    def flush(self) -> bool:
+        """Write any pending save immediately."""
+        # _save_lock only guards the hand-off so save_config never waits on disk I/O
+        with self._write_lock:
+            with self._save_lock:
+                snapshot, self._pending_snapshot = self._pending_snapshot, None
+                self._save_requested.clear()
+            if snapshot is None:
+                return True
+            try:
+                payload = self._encode_config(snapshot)
+            except (TypeError, ValueError) as e:
+                log.error("Failed to save config: %s", e)
+                return False
+            # Identical bytes to the last write: leave the file alone
+            digest = hash(payload)
+            if digest == self._last_saved_hash:
+                return True
+            if not self._write_config(payload, self.config_path):
+                return False
+            self._last_saved_hash = digest
+            return True
+    
+    @staticmethod
+    def _save_worker(ref, requested: threading.Event):
+        # Only a weak reference is held between saves, so the thread never pins
+        # its manager; it exits once the manager has been collected
+        while requested.wait():
+            time.sleep(ConfigManager.SAVE_DEBOUNCE)
+            manager = ref()
+            if manager is None:
+                return
+            try:
+                manager.flush()
+            except Exception:
+                # Keep the writer alive so later saves still go through
+                log.exception("Background config save failed")
+            del manager
+    
+    @staticmethod
+    def _flush_at_exit(ref):
+        manager = ref()
+        if manager is not None:
+            manager.flush()
+    
+    def _snapshot(self) -> Dict[str, Any]:
+        """Copy the current settings into a plain dict ready for serialization."""
+        # Shallow copies are enough: the settings are flat, and their list and
+        # dict fields are only ever replaced, never mutated in place
+        config_data = {
+            'display': self.display.to_dict(),
+            'gameplay': self.gameplay.to_dict(),
+            'audio': self.audio.to_dict(),
+            'controls': self.controls.to_dict(),
+            'theme': self.theme.to_dict(),
+            'developer': self.developer.to_dict(),
+            'high_scores': {mode: sorted(scores, reverse=True)
+                            for mode, scores in self.high_scores.items()},
+            'statistics': copy.deepcopy(self.statistics)
+        }
+        
+        # Convert enum to string
+        config_data['theme']['current_theme'] = _THEME_VALUES[self.theme.current_theme]
+        return config_data
+    
+    @staticmethod
+    def _encode_config(config_data: Dict[str, Any]) -> bytes:
+        if HAS_ORJSON:
+            return orjson.dumps(
+                config_data,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE
+            )
+        return (json.dumps(config_data, indent=2, ensure_ascii=False) + '\n').encode('utf-8')
+    
+    def _write_config(self, payload: bytes, path: Path) -> bool:
+        """Atomically replace the config file at path with payload."""
         try:
             # Ensure config directory exists
-            self.config_path.parent.mkdir(parents=True, exist_ok=True)
-            
-            # Prepare data for serialization
-            config_data = {
-                'display': asdict(self.display),
-                'gameplay': asdict(self.gameplay),
-                'audio': asdict(self.audio),
-                'controls': asdict(self.controls),
-                'theme': asdict(self.theme),
-                'developer': asdict(self.developer),
-                'high_scores': self.high_scores,
-                'statistics': self.statistics
-            }
+            path.parent.mkdir(parents=True, exist_ok=True)
             
-            # Convert enum to string
-            config_data['theme']['current_theme'] = self.theme.current_theme.value
+            # Write to a sibling temp file and swap it in so a crash never leaves a torn file
+            tmp_path = path.with_name(path.name + '.tmp')
+            with open(tmp_path, 'wb') as f:
+                # One write of the pre-encoded payload, synced before the swap
+                f.write(payload)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, path)
             
-            with open(self.config_path, 'w', encoding='utf-8') as f:
-                json.dump(config_data, f, indent=2, ensure_ascii=False)
-            
-            print(f"Configuration saved to {self.config_path}")
+            log.info("Configuration saved to %s", path)
             return True
             
-        except Exception as e:
-            print(f"Failed to save config: {e}")
+        except OSError as e:
+            log.error("Failed to save config: %s", e)
             return False
     
     def reset_to_defaults(self):
@@ -207,17 +475,18 @@ class ConfigManager:
         self.controls = ControlSettings()
         self.theme = ThemeSettings()
         self.developer = DeveloperSettings()
-        print("Configuration reset to defaults")
+        self.settings_version += 1
+        log.info("Configuration reset to defaults")
     
     def update_high_score(self, mode: str, score: int) -> bool:
         """Update high score for a game mode."""
-        if mode not in self.high_scores:
-            self.high_scores[mode] = []
+        scores = self.high_scores.setdefault(mode, [])
         
-        # Add score and keep top 10
-        self.high_scores[mode].append(score)
-        self.high_scores[mode].sort(reverse=True)
-        self.high_scores[mode] = self.high_scores[mode][:10]
+        # Min-heap of the top scores: the lowest kept score is always scores[0]
+        if len(scores) < self.HIGH_SCORE_LIMIT:
+            heapq.heappush(scores, score)
+        else:
+            heapq.heappushpop(scores, score)
         
         # Update statistics
         if score > self.statistics['highest_score']:
@@ -228,164 +497,82 @@ class ConfigManager:
     
     def get_high_scores(self, mode: str, limit: int = 10) -> List[int]:
         """Get high scores for a game mode."""
-        return self.high_scores.get(mode, [])[:limit]
+        return heapq.nlargest(limit, self.high_scores.get(mode, []))
     
     def update_statistics(self, **kwargs):
         """Update game statistics."""
+        stats = self.statistics
         for key, value in kwargs.items():
-            if key in self.statistics:
-                if key == "total_playtime":
-                    self.statistics[key] += value
-                elif key == "total_games":
-                    self.statistics[key] += 1
-                elif key in ["longest_snake", "power_ups_collected"]:
-                    self.statistics[key] += value
-                else:
-                    self.statistics[key] = value
+            if key in stats:
+                combine = self._STAT_UPDATES.get(key)
+                stats[key] = value if combine is None else combine(stats[key], value)
+    
+    def tick_playtime(self, seconds: float):
+        """Add play time without going through the generic update path."""
+        self.statistics['total_playtime'] += seconds
     
     def get_display_mode(self) -> Tuple[int, int, int]:
         """Get pygame display mode flags."""
-        flags = pygame.DOUBLEBUF | pygame.HWSURFACE
-        
-        if self.display.fullscreen:
-            flags |= pygame.FULLSCREEN
-        if self.display.vsync:
-            flags |= pygame.SCALED
+        display = self.display
+        # Keyed on the inputs rather than invalidated on set(), because callers
+        # such as Game.toggle_fullscreen assign display fields directly
+        key = (display.fullscreen, display.vsync)
+        flags = self._display_flags.get(key)
+        if flags is None:
+            import pygame
+            flags = pygame.DOUBLEBUF | pygame.HWSURFACE
+            if display.fullscreen:
+                flags |= pygame.FULLSCREEN
+            if display.vsync:
+                flags |= pygame.SCALED
+            self._display_flags[key] = flags
             
-        return self.display.width, self.display.height, flags
+        return display.width, display.height, flags
     
-    def get_theme_colors(self) -> Dict[str, Tuple[int, int, int]]:
+    def get_theme_colors(self) -> Mapping[str, Tuple[int, int, int]]:
         """Get color scheme for current theme."""
-        themes = {
-            Theme.GHOSTKITTY: {
-                'background': (0, 0, 0),
-                'snake': (0, 255, 0),
-                'food': (255, 0, 0),
-                'ui_text': (255, 255, 255),
-                'neon_blue': (0, 191, 255),
-                'neon_pink': (255, 20, 147),
-                'neon_green': (50, 205, 50),
-                'neon_yellow': (255, 255, 0),
-                'neon_purple': (138, 43, 226),
-                'neon_orange': (255, 140, 0)
-            },
-            Theme.NEON: {
-                'background': (10, 10, 30),
-                'snake': (0, 255, 255),
-                'food': (255, 0, 255),
-                'ui_text': (255, 255, 255),
-                'neon_blue': (0, 255, 255),
-                'neon_pink': (255, 0, 255),
-                'neon_green': (0, 255, 0),
-                'neon_yellow': (255, 255, 0),
-                'neon_purple': (128, 0, 255),
-                'neon_orange': (255, 128, 0)
-            },
-            Theme.RETRO: {
-                'background': (64, 128, 64),
-                'snake': (255, 255, 255),
-                'food': (255, 255, 0),
-                'ui_text': (255, 255, 255),
-                'neon_blue': (128, 128, 255),
-                'neon_pink': (255, 128, 128),
-                'neon_green': (128, 255, 128),
-                'neon_yellow': (255, 255, 128),
-                'neon_purple': (255, 128, 255),
-                'neon_orange': (255, 192, 128)
-            },
-            Theme.MINIMAL: {
-                'background': (32, 32, 32),
-                'snake': (200, 200, 200),
-                'food': (150, 150, 150),
-                'ui_text': (255, 255, 255),
-                'neon_blue': (100, 100, 150),
-                'neon_pink': (150, 100, 150),
-                'neon_green': (100, 150, 100),
-                'neon_yellow': (150, 150, 100),
-                'neon_purple': (128, 100, 150),
-                'neon_orange': (150, 125, 100)
-            }
-        }
-        
-        if self.theme.current_theme == Theme.CUSTOM:
-            return self.theme.custom_colors
-        
-        return themes.get(self.theme.current_theme, themes[Theme.GHOSTKITTY])
+        theme = self.theme
+        if theme.current_theme is _THEME_CUSTOM:
+            return theme.custom_colors
+        return THEME_COLORS.get(theme.current_theme, _DEFAULT_THEME_COLORS)
     
     def export_config(self, path: str) -> bool:
         """Export configuration to a specific file."""
         try:
-            old_path = self.config_path
-            self.config_path = Path(path)
-            result = self.save_config()
-            self.config_path = old_path
-            return result
-        except Exception as e:
-            print(f"Failed to export config: {e}")
+            return self._write_config(self._encode_config(self._snapshot()), Path(path))
+        except (KeyError, TypeError, ValueError) as e:
+            log.error("Failed to export config: %s", e)
             return False
     
     def import_config(self, path: str) -> bool:
         """Import configuration from a specific file."""
+        # load_config reports its own failures; just make sure the path is restored
+        old_path = self.config_path
+        self.config_path = Path(path)
         try:
-            old_path = self.config_path
-            self.config_path = Path(path)
-            result = self.load_config()
+            return self.load_config()
+        finally:
             self.config_path = old_path
-            return result
-        except Exception as e:
-            print(f"Failed to import config: {e}")
-            return False
     
     def get(self, key: str, default=None):
         """Get configuration value using dot notation."""
-        try:
-            keys = key.split('.')
-            
-            # Get the main section
-            if keys[0] == 'app':
-                if keys[1] == 'version':
-                    return "2.1.0"
-                elif keys[1] == 'name':
-                    return "SNAKEIUM"
-            elif keys[0] == 'display':
-                return getattr(self.display, keys[1], default)
-            elif keys[0] == 'gameplay':
-                return getattr(self.gameplay, keys[1], default)
-            elif keys[0] == 'audio':
-                return getattr(self.audio, keys[1], default)
-            elif keys[0] == 'controls':
-                return getattr(self.controls, keys[1], default)
-            elif keys[0] == 'theme':
-                return getattr(self.theme, keys[1], default)
-            elif keys[0] == 'developer':
-                return getattr(self.developer, keys[1], default)
-            elif keys[0] == 'statistics':
-                return self.statistics.get(keys[1], default)
-            else:
-                return default
-        except (AttributeError, IndexError):
+        if key in self._APP_INFO:
+            return self._APP_INFO[key]
+        section, _, attr = key.partition('.')
+        if section == 'statistics':
+            return self.statistics.get(attr, default)
+        if section not in self._SECTION_FIELDS:
             return default
+        return getattr(getattr(self, section), attr, default)
     
     def set(self, key: str, value):
         """Set configuration value using dot notation."""
-        try:
-            keys = key.split('.')
-            
-            # Set the value in the appropriate section
-            if keys[0] == 'display':
-                setattr(self.display, keys[1], value)
-            elif keys[0] == 'gameplay':
-                setattr(self.gameplay, keys[1], value)
-            elif keys[0] == 'audio':
-                setattr(self.audio, keys[1], value)
-            elif keys[0] == 'controls':
-                setattr(self.controls, keys[1], value)
-            elif keys[0] == 'theme':
-                setattr(self.theme, keys[1], value)
-            elif keys[0] == 'developer':
-                setattr(self.developer, keys[1], value)
-            elif keys[0] == 'statistics':
-                self.statistics[keys[1]] = value
-                
-        except (AttributeError, IndexError) as e:
-            print(f"Warning: Failed to set {key} = {value}: {e}")
+        section, _, attr = key.partition('.')
+        if section == 'statistics' and attr:
+            self.statistics[attr] = value
+        elif attr in self._SECTION_FIELDS.get(section, ()):
+            setattr(getattr(self, section), attr, value)
+            self.settings_version += 1
+        else:
+            # Reject typos up front instead of creating attributes that never get saved
+            log.warning("Failed to set %s = %r: unknown config key", key, value)
@@ -4,19 +4,47 @@ Main game logic, entities, and game loop management.
 """
 
 import pygame
+import functools
+import logging
 import random
 import math
+import colorsys
 import time
 import sys
-from typing import List, Tuple, Optional, Dict, Any
+from typing import Callable, Iterable, List, Mapping, NamedTuple, Tuple, Optional, Dict, Any
 from enum import Enum
-from dataclasses import dataclass
+from collections import deque
+from types import MappingProxyType
+from itertools import islice
 import threading
 from pathlib import Path
 
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
 from .config_manager import ConfigManager, GameMode, Theme
 from .audio_manager import AudioManager, AudioEvent
-from .ui_manager import UIManager
+from .ui_manager import TextCache, UIManager
+
+log = logging.getLogger(__name__)
+
+
+# Fully saturated hues, 256 steps around the colour wheel
+_RAINBOW_LUT = tuple(
+    tuple(int(c * 255) for c in colorsys.hsv_to_rgb(i / 256, 1.0, 1.0))
+    for i in range(256)
+)
+
+
+# Dark colour-cycling background shades, indexed by hue like _RAINBOW_LUT
+_BACKGROUND_LUT = tuple(
+    tuple(int(127 + 127 * math.sin((i / 256 + shift) * 2 * math.pi)) // 8
+          for shift in (0.0, 0.33, 0.66))
+    for i in range(256)
+)
 
 
 class Direction(Enum):
@@ -44,113 +72,357 @@ class GameState(Enum):
     GAME_OVER = "game_over"
 
 
-@dataclass
-class Position:
+# States in which the playfield is drawn
+_DRAW_STATES = frozenset({GameState.PLAYING, GameState.PAUSED, GameState.GAME_OVER})
+
+
+# Default body colour darkening towards the tail, indexed by min(segment, 25)
+_BODY_SHADES = tuple((0, 200 - min(50, i * 2), 0) for i in range(26))
+
+# Outlined body tiles keyed by (colour, grid size), built on first use
+_BODY_TILES: Dict[Tuple[Tuple[int, int, int], int], pygame.Surface] = {}
+
+
+def _body_tile(color: Tuple[int, int, int], grid_size: int) -> pygame.Surface:
+    """Return a cached grid_size tile filled with ``color`` and outlined."""
+    key = (color, grid_size)
+    tile = _BODY_TILES.get(key)
+    if tile is None:
+        tile = pygame.Surface((grid_size, grid_size)).convert()
+        tile.fill(color)
+        pygame.draw.rect(tile, (0, 100, 0), tile.get_rect(), 1)
+        _BODY_TILES[key] = tile
+    return tile
+
+
+# Outlined head tiles with eyes, keyed by (colour, grid size, facing)
+_HEAD_TILES: Dict[Tuple[Tuple[int, int, int], int, Direction], pygame.Surface] = {}
+
+# Counter-clockwise rotation of the upward-facing head for each direction
+_HEAD_ROTATION = {Direction.UP: 0, Direction.LEFT: 90, Direction.DOWN: 180, Direction.RIGHT: 270}
+
+
+def _head_tile(color: Tuple[int, int, int], grid_size: int, direction: Direction) -> pygame.Surface:
+    """Return a cached head tile with its eyes towards ``direction``."""
+    key = (color, grid_size, direction)
+    tile = _HEAD_TILES.get(key)
+    if tile is None:
+        tile = pygame.Surface((grid_size, grid_size))
+        tile.fill(color)
+        pygame.draw.rect(tile, (255, 255, 255), tile.get_rect(), 2)
+        
+        eye_size = max(2, grid_size // 8)
+        eye_offset = grid_size // 4
+        for eye_x in (eye_offset, grid_size - eye_offset):
+            pygame.draw.circle(tile, (255, 255, 255), (eye_x, eye_offset), eye_size)
+            pygame.draw.circle(tile, (0, 0, 0), (eye_x, eye_offset), eye_size // 2)
+        
+        tile = pygame.transform.rotate(tile, _HEAD_ROTATION[direction]).convert()
+        _HEAD_TILES[key] = tile
+    return tile
+
+
+class Position(NamedTuple):
+    """Grid cell; a plain tuple underneath, so equality and hashing run in C."""
     x: int
     y: int
     
     def __add__(self, other):
-        return Position(self.x + other.x, self.y + other.y)
-    
-    def __eq__(self, other):
-        return self.x == other.x and self.y == other.y
+        return Position(self.x + other[0], self.y + other[1])
     
     def to_tuple(self):
         return (self.x, self.y)
 
 
-class Particle:
-    """Enhanced particle system for visual effects."""
-    
-    def __init__(self, x: float, y: float, velocity: Tuple[float, float], 
-                 color: Tuple[int, int, int], lifetime: int = 60, size: int = 3):
-        self.x = x
-        self.y = y
-        self.vx, self.vy = velocity
-        self.color = color
-        self.lifetime = lifetime
-        self.max_lifetime = lifetime
-        self.size = size
-        self.gravity = 0.1
-        self.fade = True
-        self.trail = []
-        
+class ParticleSystem:
+    """Particle pool stored as parallel column buffers.
+
+    Physics, lifetime bookkeeping and bursts run as whole-array numpy
+    operations, and drawing is one blits() call of cached circle sprites.
+    Without numpy the same columns are kept as rows in a bounded deque.
+
+    When ``threaded`` is set, step_async() hands the physics step to a
+    worker thread. The main thread must not touch the columns until
+    sync(), so spawns made meanwhile are staged and applied afterwards,
+    and draw() syncs before reading. An exception raised by the worker's
+    step is re-raised from the next sync().
+    """
+
+    GRAVITY = 0.1
+    DRAG = 0.98
+    FADE_LEVELS = 16
+
+    def __init__(self, capacity: int, threaded: bool = False):
+        self.capacity = max(1, capacity)
+        self.count = 0
+        self.threaded = threaded
+        self._stepping = False
+        self._staged = []
+        self._worker = None
+        self._error: Optional[BaseException] = None
+        self._closing = False
+        self._tick = threading.Event()
+        self._done = threading.Event()
+        self._sprites: Dict[Tuple[Tuple[int, int, int], int], pygame.Surface] = {}
+        if HAS_NUMPY:
+            self.x = np.zeros(self.capacity, np.float32)
+            self.y = np.zeros(self.capacity, np.float32)
+            self.vx = np.zeros(self.capacity, np.float32)
+            self.vy = np.zeros(self.capacity, np.float32)
+            self.life = np.zeros(self.capacity, np.float32)
+            self.max_life = np.ones(self.capacity, np.float32)
+            self.size = np.zeros(self.capacity, np.float32)
+            self.color = np.zeros((self.capacity, 3), np.uint8)
+            self._columns = (self.x, self.y, self.vx, self.vy,
+                             self.life, self.max_life, self.size, self.color)
+        else:
+            self.rows = deque(maxlen=self.capacity)
+
+    def __len__(self):
+        return self.count
+
+    def clear(self):
+        self.sync()
+        self._staged = []
+        self.count = 0
+        if not HAS_NUMPY:
+            self.rows = deque(maxlen=self.capacity)
+
+    def clear_sprites(self):
+        """Forget the cached sprites, e.g. after the display format changes."""
+        self._sprites.clear()
+
+    def step_async(self):
+        """Start this frame's update on the worker thread, if enabled."""
+        if not self.threaded:
+            self.update()
+            return
+        self.sync()
+        if self._worker is None:
+            self._worker = threading.Thread(target=self._run_worker,
+                                            name="particles", daemon=True)
+            self._worker.start()
+        self._stepping = True
+        self._tick.set()
+
+    def sync(self):
+        """Wait for a pending step and apply the spawns staged during it."""
+        if self._stepping:
+            self._done.wait()
+            self._done.clear()
+            self._stepping = False
+        if self._staged:
+            staged, self._staged = self._staged, []
+            for args in staged:
+                self.spawn(*args)
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+    def close(self):
+        """Stop the worker thread."""
+        try:
+            self.sync()
+        finally:
+            if self._worker is not None:
+                self._closing = True
+                self._tick.set()
+                self._worker.join()
+                self._worker = None
+
+    def _run_worker(self):
+        while True:
+            self._tick.wait()
+            self._tick.clear()
+            if self._closing:
+                return
+            try:
+                self.update()
+            except Exception as e:
+                log.exception("Particle update failed")
+                self._error = e
+            finally:
+                self._done.set()
+
+    def spawn(self, x: float, y: float, vx: float, vy: float,
+              color: Tuple[int, int, int], life: int = 60, size: int = 3):
+        """Add one particle, dropping the oldest one when the pool is full."""
+        if self._stepping:
+            self._staged.append((x, y, vx, vy, color, life, size))
+            return
+        if not HAS_NUMPY:
+            # The deque's maxlen evicts the oldest particle when full
+            self.rows.append([x, y, vx, vy, life, life, size, color])
+            self.count = len(self.rows)
+            return
+        i = self.count
+        if i == self.capacity:
+            for column in self._columns:
+                column[:-1] = column[1:]
+            i -= 1
+        else:
+            self.count += 1
+        self.x[i] = x
+        self.y[i] = y
+        self.vx[i] = vx
+        self.vy[i] = vy
+        self.life[i] = life
+        self.max_life[i] = life
+        self.size[i] = size
+        self.color[i] = color
+
+    def burst(self, x: float, y: float, count: int,
+              vx_range: Tuple[float, float], vy_range: Tuple[float, float],
+              colors: List[Tuple[int, int, int]], life: int = 60, size: int = 3):
+        """Spawn ``count`` particles at one point with random velocities and colours."""
+        if self._stepping or not HAS_NUMPY:
+            for _ in range(count):
+                self.spawn(x, y, random.uniform(*vx_range), random.uniform(*vy_range),
+                           random.choice(colors), life, size)
+            return
+        count = min(count, self.capacity)
+        overflow = self.count + count - self.capacity
+        if overflow > 0:
+            # Drop the oldest particles in one shift to make room
+            for column in self._columns:
+                column[:self.count - overflow] = column[overflow:self.count]
+            self.count -= overflow
+        new = slice(self.count, self.count + count)
+        self.x[new] = x
+        self.y[new] = y
+        self.vx[new] = np.random.uniform(*vx_range, count)
+        self.vy[new] = np.random.uniform(*vy_range, count)
+        self.life[new] = life
+        self.max_life[new] = life
+        self.size[new] = size
+        self.color[new] = np.asarray(colors, np.uint8)[np.random.randint(len(colors), size=count)]
+        self.count += count
+
     def update(self):
-        """Update particle physics."""
-        self.x += self.vx
-        self.y += self.vy
-        self.vy += self.gravity
-        self.lifetime -= 1
-        
-        # Add to trail
-        if len(self.trail) > 5:
-            self.trail.pop(0)
-        self.trail.append((self.x, self.y))
-        
-        # Reduce velocity over time
-        self.vx *= 0.98
-        self.vy *= 0.98
-    
+        """Advance every particle one frame and compact out the dead ones."""
+        if not HAS_NUMPY:
+            gravity, drag = self.GRAVITY, self.DRAG
+            dead = 0
+            for row in self.rows:
+                row[0] += row[2]
+                row[1] += row[3]
+                row[3] += gravity
+                row[4] -= 1
+                row[2] *= drag
+                row[3] *= drag
+                if row[4] <= 0:
+                    dead += 1
+            # Most frames nothing expires, so only rebuild the deque when needed
+            if dead:
+                self.rows = deque((row for row in self.rows if row[4] > 0), maxlen=self.capacity)
+                self.count = len(self.rows)
+            return
+        n = self.count
+        if not n:
+            return
+        self.x[:n] += self.vx[:n]
+        self.y[:n] += self.vy[:n]
+        self.vy[:n] += self.GRAVITY
+        self.life[:n] -= 1
+        self.vx[:n] *= self.DRAG
+        self.vy[:n] *= self.DRAG
+        alive = self.life[:n] > 0
+        n2 = int(alive.sum())
+        if n2 != n:
+            for column in self._columns:
+                column[:n2] = column[:n][alive]
+            self.count = n2
+
     def draw(self, screen: pygame.Surface):
-        """Draw particle with trail effect."""
-        if self.lifetime <= 0:
+        """Draw particles, shrinking and fading them as they age."""
+        self.sync()
+        if not HAS_NUMPY:
+            sprite = self._sprite
+            levels = self.FADE_LEVELS
+            blits = []
+            for x, y, _, _, life, max_life, size, color in self.rows:
+                alpha = math.ceil(life / max_life * levels) / levels
+                radius = max(1, int(size * alpha))
+                faded = tuple(int(c * alpha) for c in color)
+                blits.append((sprite(faded, radius), (int(x) - radius, int(y) - radius)))
+            screen.blits(blits, False)
             return
-        
-        alpha = 1.0 if not self.fade else (self.lifetime / self.max_lifetime)
-        
-        # Draw trail
-        for i, (tx, ty) in enumerate(self.trail):
-            trail_alpha = alpha * (i / len(self.trail))
-            trail_size = max(1, int(self.size * trail_alpha))
-            trail_color = tuple(int(c * trail_alpha) for c in self.color)
-            pygame.draw.circle(screen, trail_color, (int(tx), int(ty)), trail_size)
-        
-        # Draw main particle
-        main_size = max(1, int(self.size * alpha))
-        main_color = tuple(int(c * alpha) for c in self.color)
-        pygame.draw.circle(screen, main_color, (int(self.x), int(self.y)), main_size)
+        n = self.count
+        if not n:
+            return
+        # Fade in FADE_LEVELS steps so the sprite cache stays small
+        levels = self.FADE_LEVELS
+        alpha = np.ceil(self.life[:n] / self.max_life[:n] * levels) / levels
+        radii = np.maximum(1, (self.size[:n] * alpha).astype(np.int32))
+        colors = (self.color[:n] * alpha[:, None]).astype(np.uint8).tolist()
+        xs = (self.x[:n].astype(np.int32) - radii).tolist()
+        ys = (self.y[:n].astype(np.int32) - radii).tolist()
+        sprite = self._sprite
+        screen.blits([(sprite(tuple(color), radius), (x, y))
+                      for x, y, color, radius in zip(xs, ys, colors, radii.tolist())], False)
+
+    def _sprite(self, color: Tuple[int, int, int], radius: int) -> pygame.Surface:
+        """Return a cached filled circle of ``radius`` in ``color``."""
+        key = (color, radius)
+        sprite = self._sprites.get(key)
+        if sprite is None:
+            sprite = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+            pygame.draw.circle(sprite, color, (radius, radius), radius)
+            sprite = self._sprites[key] = sprite.convert_alpha()
+        return sprite
+
+
+def _occupancy_grid(grid_width: int, grid_height: int, cells: Iterable[Position]) -> bytearray:
+    """Per-cell counts for ``cells``, indexed ``y * grid_width + x``."""
+    occupied = bytearray(grid_width * grid_height)
+    for pos in cells:
+        occupied[pos.y * grid_width + pos.x] += 1
+    return occupied
+
+
+def _random_free_cell(grid_width: int, grid_height: int, occupied: bytearray,
+                      attempts: int = 100) -> Optional[Position]:
+    """Pick a random unoccupied cell, or None when the grid is full."""
+    size = grid_width * grid_height
+    for _ in range(attempts):
+        idx = random.randrange(size)
+        if not occupied[idx]:
+            return Position(idx % grid_width, idx // grid_width)
     
-    def is_alive(self) -> bool:
-        return self.lifetime > 0
+    # Crowded grid: choose directly among the free cells
+    free = [i for i, v in enumerate(occupied) if not v]
+    if not free:
+        return None
+    idx = random.choice(free)
+    return Position(idx % grid_width, idx // grid_width)
 
 
 class Food:
     """Enhanced food with different types and effects."""
     
-    def __init__(self, grid_width: int, grid_height: int, snake_body: List[Position]):
+    # Type-specific properties, shared by every instance
+    PROPERTIES: Mapping[str, Mapping[str, Any]] = MappingProxyType({
+        'normal': MappingProxyType({'score': 10, 'color': (255, 0, 0), 'size': 1}),
+        'golden': MappingProxyType({'score': 50, 'color': (255, 215, 0), 'size': 1.2}),
+        'mega': MappingProxyType({'score': 100, 'color': (255, 140, 0), 'size': 1.5}),
+    })
+    TYPES = tuple(PROPERTIES)
+    
+    def __init__(self, grid_width: int, grid_height: int, snake_body: Iterable[Position],
+                 occupied: Optional[bytearray] = None):
         self.grid_width = grid_width
         self.grid_height = grid_height
-        self.position = self._generate_position(snake_body)
-        self.type = random.choice(['normal', 'golden', 'mega'])
+        self.position = self._generate_position(snake_body, occupied)
+        self.type = random.choice(self.TYPES)
         self.pulse = 0.0
         self.spawn_time = time.time()
-        
-        # Type-specific properties
-        self.properties = {
-            'normal': {'score': 10, 'color': (255, 0, 0), 'size': 1},
-            'golden': {'score': 50, 'color': (255, 215, 0), 'size': 1.2},
-            'mega': {'score': 100, 'color': (255, 140, 0), 'size': 1.5}
-        }
     
-    def _generate_position(self, snake_body: List[Position]) -> Position:
+    def _generate_position(self, snake_body: Iterable[Position],
+                           occupied: Optional[bytearray] = None) -> Position:
         """Generate a valid position for food."""
-        max_attempts = 100
-        for _ in range(max_attempts):
-            x = random.randint(0, self.grid_width - 1)
-            y = random.randint(0, self.grid_height - 1)
-            pos = Position(x, y)
-            
-            if pos not in snake_body:
-                return pos
-        
-        # Fallback: find first empty position
-        for y in range(self.grid_height):
-            for x in range(self.grid_width):
-                pos = Position(x, y)
-                if pos not in snake_body:
-                    return pos
-        
-        return Position(0, 0)  # Last resort
+        if occupied is None:
+            occupied = _occupancy_grid(self.grid_width, self.grid_height, snake_body)
+        return _random_free_cell(self.grid_width, self.grid_height, occupied) or Position(0, 0)
     
     def update(self):
         """Update food animation."""
@@ -158,7 +430,7 @@ class Food:
     
     def draw(self, screen: pygame.Surface, grid_size: int):
         """Draw food with pulsing effect."""
-        props = self.properties[self.type]
+        props = self.PROPERTIES[self.type]
         pulse_factor = 1 + 0.2 * math.sin(self.pulse)
         size = int(grid_size * props['size'] * pulse_factor)
         
@@ -180,58 +452,63 @@ class Food:
                           max(1, size // 6))
     
     def get_score_value(self) -> int:
-        return self.properties[self.type]['score']
+        return self.PROPERTIES[self.type]['score']
 
 
 class PowerUp:
     """Enhanced power-up system."""
     
-    def __init__(self, grid_width: int, grid_height: int, snake_body: List[Position]):
+    # Type-specific properties, shared by every instance
+    PROPERTIES: Mapping[PowerUpType, Mapping[str, Any]] = MappingProxyType({
+        PowerUpType.SPEED_BOOST: MappingProxyType({'color': (0, 191, 255), 'symbol': 'S'}),
+        PowerUpType.SCORE_MULTIPLIER: MappingProxyType({'color': (255, 255, 0), 'symbol': 'x'}),
+        PowerUpType.RAINBOW_MODE: MappingProxyType({'color': (138, 43, 226), 'symbol': 'R'}),
+        PowerUpType.MEGA_FOOD: MappingProxyType({'color': (255, 140, 0), 'symbol': 'M'}),
+        PowerUpType.SHIELD: MappingProxyType({'color': (0, 255, 0), 'symbol': '+'}),
+        PowerUpType.SLOW_TIME: MappingProxyType({'color': (128, 0, 128), 'symbol': 'T'}),
+        PowerUpType.DOUBLE_SCORE: MappingProxyType({'color': (255, 69, 0), 'symbol': 'D'}),
+        PowerUpType.TELEPORT: MappingProxyType({'color': (0, 255, 255), 'symbol': 'W'}),
+    })
+    TYPES = tuple(PROPERTIES)
+    
+    def __init__(self, grid_width: int, grid_height: int, snake_body: Iterable[Position],
+                 occupied: Optional[bytearray] = None):
         self.grid_width = grid_width
         self.grid_height = grid_height
-        self.position = self._generate_position(snake_body)
-        self.type = random.choice(list(PowerUpType))
+        self.position = self._generate_position(snake_body, occupied)
+        self.type = random.choice(self.TYPES)
         self.spawn_time = time.time()
         self.lifetime = 15  # seconds
         self.pulse = 0.0
         self.rotation = 0.0
-        
-        # Type-specific properties
-        self.properties = {
-            PowerUpType.SPEED_BOOST: {'color': (0, 191, 255), 'symbol': 'S'},
-            PowerUpType.SCORE_MULTIPLIER: {'color': (255, 255, 0), 'symbol': 'x'},
-            PowerUpType.RAINBOW_MODE: {'color': (138, 43, 226), 'symbol': 'R'},
-            PowerUpType.MEGA_FOOD: {'color': (255, 140, 0), 'symbol': 'M'},
-            PowerUpType.SHIELD: {'color': (0, 255, 0), 'symbol': '+'},
-            PowerUpType.SLOW_TIME: {'color': (128, 0, 128), 'symbol': 'T'},
-            PowerUpType.DOUBLE_SCORE: {'color': (255, 69, 0), 'symbol': 'D'},
-            PowerUpType.TELEPORT: {'color': (0, 255, 255), 'symbol': 'W'}
-        }
     
-    def _generate_position(self, snake_body: List[Position]) -> Position:
+    def _generate_position(self, snake_body: Iterable[Position],
+                           occupied: Optional[bytearray] = None) -> Position:
         """Generate a valid position for power-up."""
-        max_attempts = 100
-        for _ in range(max_attempts):
-            x = random.randint(0, self.grid_width - 1)
-            y = random.randint(0, self.grid_height - 1)
-            pos = Position(x, y)
-            
-            if pos not in snake_body:
-                return pos
-        
-        return Position(0, 0)
+        if occupied is None:
+            occupied = _occupancy_grid(self.grid_width, self.grid_height, snake_body)
+        return _random_free_cell(self.grid_width, self.grid_height, occupied) or Position(0, 0)
     
     def update(self):
         """Update power-up animation."""
         self.pulse += 0.3
         self.rotation += 5
     
-    def is_expired(self) -> bool:
-        return time.time() - self.spawn_time > self.lifetime
+    def is_expired(self, now: Optional[float] = None) -> bool:
+        if now is None:
+            now = time.time()
+        return now - self.spawn_time > self.lifetime
+    
+    @classmethod
+    def render_symbols(cls, font: pygame.font.Font) -> Dict[PowerUpType, pygame.Surface]:
+        """Pre-render every power-up symbol once for use with draw()."""
+        return {power_type: font.render(props['symbol'], True, (255, 255, 255))
+                for power_type, props in cls.PROPERTIES.items()}
     
-    def draw(self, screen: pygame.Surface, grid_size: int, font: pygame.font.Font):
+    def draw(self, screen: pygame.Surface, grid_size: int,
+             symbols: Dict[PowerUpType, pygame.Surface]):
         """Draw power-up with animated effects."""
-        props = self.properties[self.type]
+        props = self.PROPERTIES[self.type]
         pulse_factor = 1 + 0.4 * math.sin(self.pulse)
         
         center_x = self.position.x * grid_size + grid_size // 2
@@ -250,7 +527,7 @@ class PowerUp:
         pygame.draw.circle(screen, (255, 255, 255), (center_x, center_y), main_radius, 2)
         
         # Draw symbol
-        symbol_surface = font.render(props['symbol'], True, (255, 255, 255))
+        symbol_surface = symbols[self.type]
         symbol_rect = symbol_surface.get_rect(center=(center_x, center_y))
         screen.blit(symbol_surface, symbol_rect)
 
@@ -258,10 +535,15 @@ class PowerUp:
 class Snake:
     """Enhanced snake with smooth movement and effects."""
     
+    # Effects that simply count down one frame at a time
+    TIMED_EFFECTS = ('speed_boost', 'rainbow_mode', 'shield', 'slow_time', 'double_score')
+    
     def __init__(self, grid_width: int, grid_height: int, initial_speed: int = 5):
         self.grid_width = grid_width
         self.grid_height = grid_height
-        self.body = [Position(grid_width // 2, grid_height // 2)]
+        self.body = deque([Position(grid_width // 2, grid_height // 2)])
+        # Number of body segments on each cell, indexed y * grid_width + x
+        self.occupied = _occupancy_grid(grid_width, grid_height, self.body)
         self.direction = Direction.RIGHT
         self.next_direction = Direction.RIGHT
         self.speed = initial_speed
@@ -281,25 +563,41 @@ class Snake:
             'slow_time': 0,
             'double_score': 0
         }
+        # Running effects and their remaining frames, kept up to date by
+        # update() and eat_powerup() so the HUD can use it as-is
+        self.active_effects: Dict[str, int] = {}
         
         # Visual properties
-        self.rainbow_hue = 0.0
+        self.rainbow_phase = 0  # 16-bit hue: 65536 is one turn of the colour wheel
         self.skin_pattern = 'default'
+        self._sparkle_frame = 0
         
     def update(self):
         """Update snake logic."""
-        # Update effects
-        for effect in ['speed_boost', 'rainbow_mode', 'shield', 'slow_time', 'double_score']:
-            if self.effects[effect] > 0:
-                self.effects[effect] -= 1
+        # Update effects, dropping expired ones from active_effects
+        effects = self.effects
+        active = self.active_effects
+        for effect in self.TIMED_EFFECTS:
+            timer = effects[effect]
+            if timer > 0:
+                effects[effect] = timer - 1
+                if timer > 1:
+                    active[effect] = timer - 1
+                else:
+                    active.pop(effect, None)
         
-        if self.effects['score_multiplier_timer'] > 0:
-            self.effects['score_multiplier_timer'] -= 1
+        timer = effects['score_multiplier_timer']
+        if timer > 0:
+            effects['score_multiplier_timer'] = timer - 1
+            if timer > 1:
+                active['score_multiplier'] = timer - 1
+            else:
+                active.pop('score_multiplier', None)
         else:
-            self.effects['score_multiplier'] = 1
+            effects['score_multiplier'] = 1
         
-        # Update rainbow effect
-        self.rainbow_hue = (self.rainbow_hue + 0.05) % 1.0
+        # Update rainbow effect (0.05 of a turn per frame)
+        self.rainbow_phase = (self.rainbow_phase + 3277) & 0xFFFF
         
         # Update movement timing
         current_speed = self.get_current_speed()
@@ -312,26 +610,31 @@ class Snake:
             self.move_timer = 0
             self.move()
     
-    def move(self):
-        """Move the snake one step."""
+    def move(self) -> bool:
+        """Move the snake one step; return True if the head ran into the body."""
         # Update direction
         self.direction = self.next_direction
         
         # Calculate new head position
         dx, dy = self.direction.value
-        new_head = Position(
-            (self.body[0].x + dx) % self.grid_width,
-            (self.body[0].y + dy) % self.grid_height
-        )
+        head = self.body[0]
+        new_head = Position((head.x + dx) % self.grid_width,
+                            (head.y + dy) % self.grid_height)
         
         # Add new head
-        self.body.insert(0, new_head)
+        self.body.appendleft(new_head)
+        occupied = self.occupied
+        head_idx = new_head.y * self.grid_width + new_head.x
+        occupied[head_idx] += 1
         
         # Handle growth
         if self.grow_pending > 0:
             self.grow_pending -= 1
         else:
-            self.body.pop()
+            tail = self.body.pop()
+            occupied[tail.y * self.grid_width + tail.x] -= 1
+        
+        return occupied[head_idx] > 1
     
     def change_direction(self, new_direction: Direction):
         """Change snake direction with collision prevention."""
@@ -350,8 +653,11 @@ class Snake:
         if self.effects['shield'] > 0:
             return False  # Shield protects from self-collision
         
-        head = self.body[0]
-        return head in self.body[1:]
+        return self.occupies(self.body[0], 2)
+    
+    def occupies(self, pos: Position, segments: int = 1) -> bool:
+        """Return True if at least ``segments`` body segments sit on ``pos``."""
+        return self.occupied[pos.y * self.grid_width + pos.x] >= segments
     
     def eat_food(self, food: Food):
         """Handle eating food."""
@@ -382,6 +688,19 @@ class Snake:
             self.effects['slow_time'] = 480  # 8 seconds
         elif effect_type == PowerUpType.DOUBLE_SCORE:
             self.effects['double_score'] = 450  # 7.5 seconds
+        
+        self._refresh_active_effects()
+    
+    def _refresh_active_effects(self):
+        """Rebuild active_effects from the effect timers."""
+        effects = self.effects
+        active = self.active_effects
+        active.clear()
+        for effect in self.TIMED_EFFECTS:
+            if effects[effect] > 0:
+                active[effect] = effects[effect]
+        if effects['score_multiplier_timer'] > 0:
+            active['score_multiplier'] = effects['score_multiplier_timer']
     
     def get_current_speed(self) -> int:
         """Get current speed including effects."""
@@ -399,77 +718,52 @@ class Snake:
             multiplier *= 2
         return multiplier
     
-    def draw(self, screen: pygame.Surface, grid_size: int, particles: List[Particle]):
+    def draw(self, screen: pygame.Surface, grid_size: int, particles: ParticleSystem):
         """Draw snake with enhanced visuals."""
         if not self.body:
             return
         
-        # Generate rainbow colors if in rainbow mode
-        if self.effects['rainbow_mode'] > 0:
-            head_color = self._get_rainbow_color(0)
-            body_color = self._get_rainbow_color(0.1)
-        else:
-            head_color = (0, 255, 0)
-            body_color = (0, 200, 0)
+        rainbow = self.effects['rainbow_mode'] > 0
+        head_color = self._get_rainbow_color(0) if rainbow else (0, 255, 0)
         
-        # Draw body segments
-        for i, segment in enumerate(self.body):
-            x = segment.x * grid_size
-            y = segment.y * grid_size
-            
-            if i == 0:  # Head
-                # Shield effect
-                if self.effects['shield'] > 0:
-                    shield_color = (0, 255, 255, 100)
-                    pygame.draw.circle(screen, (0, 255, 255), 
-                                     (x + grid_size // 2, y + grid_size // 2), 
-                                     grid_size // 2 + 5)
-                
-                pygame.draw.rect(screen, head_color, (x, y, grid_size, grid_size))
-                pygame.draw.rect(screen, (255, 255, 255), (x, y, grid_size, grid_size), 2)
-                
-                # Draw eyes
-                eye_size = max(2, grid_size // 8)
-                eye_offset = grid_size // 4
-                pygame.draw.circle(screen, (255, 255, 255), 
-                                 (x + eye_offset, y + eye_offset), eye_size)
-                pygame.draw.circle(screen, (255, 255, 255), 
-                                 (x + grid_size - eye_offset, y + eye_offset), eye_size)
-                pygame.draw.circle(screen, (0, 0, 0), 
-                                 (x + eye_offset, y + eye_offset), eye_size // 2)
-                pygame.draw.circle(screen, (0, 0, 0), 
-                                 (x + grid_size - eye_offset, y + eye_offset), eye_size // 2)
-            else:  # Body
-                # Vary color slightly for each segment
-                if self.effects['rainbow_mode'] > 0:
-                    segment_color = self._get_rainbow_color(i * 0.05)
-                else:
-                    darkness = min(50, i * 2)
-                    segment_color = (max(0, body_color[0] - darkness), 
-                                   max(0, body_color[1] - darkness), 
-                                   max(0, body_color[2] - darkness))
-                
-                pygame.draw.rect(screen, segment_color, (x, y, grid_size, grid_size))
-                pygame.draw.rect(screen, (0, 100, 0), (x, y, grid_size, grid_size), 1)
-        
-        # Generate particle effects
-        if self.effects['rainbow_mode'] > 0 and random.random() < 0.3:
-            head = self.body[0]
-            particles.append(Particle(
+        # Draw head
+        head = self.body[0]
+        x = head.x * grid_size
+        y = head.y * grid_size
+        
+        # Shield effect
+        if self.effects['shield'] > 0:
+            pygame.draw.circle(screen, (0, 255, 255), 
+                             (x + grid_size // 2, y + grid_size // 2), 
+                             grid_size // 2 + 5)
+        
+        screen.blit(_head_tile(head_color, grid_size, self.direction), (x, y))
+        
+        # Draw body segments as one batch of pre-rendered tiles,
+        # varying the colour slightly for each segment
+        if rainbow:
+            rainbow_base = self.rainbow_phase >> 8
+            colors = [_RAINBOW_LUT[(rainbow_base + i * 13) & 255]
+                      for i in range(1, len(self.body))]
+        else:
+            colors = [_BODY_SHADES[min(i, 25)] for i in range(1, len(self.body))]
+        screen.blits([(_body_tile(color, grid_size), (segment.x * grid_size, segment.y * grid_size))
+                      for color, segment in zip(colors, islice(self.body, 1, None))], False)
+        
+        # Generate particle effects, one sparkle every third frame
+        self._sparkle_frame = (self._sparkle_frame + 1) % 3
+        if rainbow and self._sparkle_frame == 0:
+            particles.spawn(
                 head.x * grid_size + grid_size // 2 + random.randint(-10, 10),
                 head.y * grid_size + grid_size // 2 + random.randint(-10, 10),
-                (random.uniform(-2, 2), random.uniform(-2, 2)),
+                random.uniform(-2, 2), random.uniform(-2, 2),
                 self._get_rainbow_color(random.random()),
                 30
-            ))
+            )
     
     def _get_rainbow_color(self, offset: float) -> Tuple[int, int, int]:
         """Get rainbow color with offset."""
-        hue = (self.rainbow_hue + offset) % 1.0
-        # Convert HSV to RGB
-        import colorsys
-        r, g, b = colorsys.hsv_to_rgb(hue, 1.0, 1.0)
-        return (int(r * 255), int(g * 255), int(b * 255))
+        return _RAINBOW_LUT[((self.rainbow_phase >> 8) + int(offset * 256)) & 255]
 
 
 class GameStats:
@@ -481,16 +775,24 @@ class GameStats:
         self.powerups_collected = 0
         self.max_length = 1
         self.distance_traveled = 0
-        self.effects_used = {}
+        self.effects_used = {}  # effect name -> number of times it switched on
+        self._active_effects = ()
     
     def update(self, snake: Snake):
         """Update statistics."""
-        self.max_length = max(self.max_length, len(snake.body))
-        
-        # Track effect usage
-        for effect, timer in snake.effects.items():
-            if timer > 0 and effect not in ['score_multiplier', 'score_multiplier_timer']:
-                self.effects_used[effect] = self.effects_used.get(effect, 0) + 1
+        length = len(snake.body)
+        if length > self.max_length:
+            self.max_length = length
+        
+        # Track effect usage, counting each activation once rather than
+        # every frame the effect stays on
+        effects = snake.effects
+        active = tuple(effect for effect in Snake.TIMED_EFFECTS if effects[effect] > 0)
+        if active != self._active_effects:
+            for effect in active:
+                if effect not in self._active_effects:
+                    self.effects_used[effect] = self.effects_used.get(effect, 0) + 1
+            self._active_effects = active
     
     def get_play_time(self) -> float:
         return time.time() - self.start_time
@@ -499,6 +801,19 @@ class GameStats:
 class Game:
     """Main game engine with enhanced features."""
     
+    # Rainbow background: visible strips, and strips per full hue cycle
+    RAINBOW_STRIPS = 30
+    RAINBOW_CYCLE = 32
+    
+    # Chance per gameplay frame that a power-up appears
+    POWERUP_CHANCE = 0.005
+    
+    # Rendered text surfaces kept for reuse
+    TEXT_CACHE_SIZE = 64
+    
+    # Seconds between lookups of the now-playing title for the HUD
+    SONG_POLL_INTERVAL = 0.5
+    
     def __init__(self, config_manager: ConfigManager = None):
         # Initialize pygame
         pygame.init()
@@ -528,13 +843,17 @@ class Game:
         self.snake = None
         self.food = None
         self.powerups = []
-        self.particles = []
-        self.obstacles = []  # For maze mode
+        self.particles = ParticleSystem(self.config.gameplay.max_particles,
+                                        self.config.gameplay.threaded_particles)
+        self.obstacles = set()  # For maze mode
+        self._obstacle_layer: Optional[pygame.Surface] = None
         
         # Game variables
         self.score = 0
         self.level = 1
         self.game_stats = None
+        self.frame_count = 0
+        self._next_powerup_frame = 0
         
         # Managers
         self.audio = AudioManager(self.config)
@@ -543,10 +862,42 @@ class Game:
         # Fonts
         self.font = pygame.font.Font(None, 36)
         self.small_font = pygame.font.Font(None, 24)
+        self._symbol_surfaces = PowerUp.render_symbols(self.small_font)
+        self.text_cache = TextCache(self.TEXT_CACHE_SIZE)
+        
+        # Now-playing title shown in the HUD, refreshed by _poll_current_song
+        self._current_song = None
+        self._last_song_poll = float('-inf')
         
         # Background effects
-        self.bg_hue = 0.0
+        self.bg_phase = 0  # 16-bit hue, as Snake.rainbow_phase
         self.bg_effects = []
+        self._rainbow_cache = None
+        self._refresh_theme()
+        
+        # Rebuilt after the display mode changes, since cached surfaces are
+        # converted to the pixel format of the display they were made for
+        self._cache_invalidators: List[Callable[[], None]] = [
+            self._reset_surface_caches,
+            self._build_obstacle_layer,
+        ]
+        
+        # Key dispatch tables: keys that work in every state, then per-state keys
+        self._global_keymap = {
+            pygame.K_F11: self.toggle_fullscreen,
+            pygame.K_F1: self.toggle_debug_mode,
+        }
+        self._state_keymaps = {
+            GameState.PAUSED: {
+                pygame.K_SPACE: self.resume_game,
+                pygame.K_ESCAPE: self.return_to_menu,
+            },
+            GameState.GAME_OVER: {
+                pygame.K_r: self.restart_game,
+                pygame.K_ESCAPE: self.return_to_menu,
+            },
+        }
+        self._build_game_keymap()
         
         print("SNAKEIUM 2.1 initialized successfully")
     
@@ -573,6 +924,7 @@ class Game:
                 new_song = self.audio.check_music()
                 if new_song:
                     print(f"Now playing: {new_song}")
+                    self._last_song_poll = float('-inf')
         
         # Cleanup
         self.cleanup()
@@ -582,37 +934,22 @@ class Game:
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 self.running = False
+                continue
             
-            elif event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_F11:
-                    self.toggle_fullscreen()
-                elif event.key == pygame.K_F1:
-                    self.config.developer.debug_mode = not self.config.developer.debug_mode
-                
-                # Handle state-specific events
-                if self.state == GameState.MENU:
-                    action = self.ui.handle_event(event)
-                    if action:
-                        self.handle_menu_action(action)
-                
-                elif self.state == GameState.PLAYING:
-                    self.handle_game_input(event.key)
-                
-                elif self.state == GameState.PAUSED:
-                    if event.key == pygame.K_SPACE:
-                        self.resume_game()
-                    elif event.key == pygame.K_ESCAPE:
-                        self.return_to_menu()
-                
-                elif self.state == GameState.GAME_OVER:
-                    if event.key == pygame.K_r:
-                        self.restart_game()
-                    elif event.key == pygame.K_ESCAPE:
-                        self.return_to_menu()
+            if event.type == pygame.KEYDOWN:
+                action = self._global_keymap.get(event.key)
+                if action:
+                    action()
             
-            # Let UI handle events
+            # The menu sees every event (keys and mouse) exactly once
             if self.state == GameState.MENU:
-                self.ui.handle_event(event)
+                menu_action = self.ui.handle_event(event)
+                if menu_action:
+                    self.handle_menu_action(menu_action)
+            elif event.type == pygame.KEYDOWN:
+                action = self._state_keymaps[self.state].get(event.key)
+                if action:
+                    action()
     
     def handle_menu_action(self, action: str):
         """Handle menu actions."""
@@ -627,45 +964,71 @@ class Game:
         elif action == "quit":
             self.running = False
     
+    def _build_game_keymap(self):
+        """Map the configured controls to in-game actions."""
+        controls = self.config.controls
+        keymap = {
+            controls.menu_key: self.pause_game,
+            controls.skip_music_key: self.skip_music,
+            controls.pause_key: self.pause_game,
+        }
+        # Movement wins over the other bindings, as it did in the old if/elif chain
+        for keys, direction in ((controls.right_keys, Direction.RIGHT),
+                                (controls.left_keys, Direction.LEFT),
+                                (controls.down_keys, Direction.DOWN),
+                                (controls.up_keys, Direction.UP)):
+            for key in keys:
+                keymap[key] = functools.partial(self.turn_snake, direction)
+        self._game_keymap = keymap
+        self._state_keymaps[GameState.PLAYING] = keymap
+        self._keymap_version = self.config.settings_version
+    
     def handle_game_input(self, key: int):
         """Handle game input during play."""
-        # Movement
-        if key in self.config.controls.up_keys:
-            self.snake.change_direction(Direction.UP)
-        elif key in self.config.controls.down_keys:
-            self.snake.change_direction(Direction.DOWN)
-        elif key in self.config.controls.left_keys:
-            self.snake.change_direction(Direction.LEFT)
-        elif key in self.config.controls.right_keys:
-            self.snake.change_direction(Direction.RIGHT)
-        
-        # Game controls
-        elif key == self.config.controls.pause_key:
-            self.pause_game()
-        elif key == self.config.controls.skip_music_key:
-            if self.audio:
-                new_song = self.audio.skip_track()
-                if new_song:
-                    print(f"Skipped to: {new_song}")
-        elif key == self.config.controls.menu_key:
-            self.pause_game()
+        action = self._game_keymap.get(key)
+        if action:
+            action()
+    
+    def turn_snake(self, direction: Direction):
+        """Steer the snake."""
+        if self.snake:
+            self.snake.change_direction(direction)
+    
+    def skip_music(self):
+        """Skip to the next music track."""
+        if self.audio:
+            new_song = self.audio.skip_track()
+            if new_song:
+                print(f"Skipped to: {new_song}")
+                self._last_song_poll = float('-inf')
+    
+    def toggle_debug_mode(self):
+        """Toggle the debug overlay."""
+        self.config.developer.debug_mode = not self.config.developer.debug_mode
     
     def start_game(self):
         """Start a new game."""
         self.state = GameState.PLAYING
         self.ui.set_state("game")
         
+        # Controls may have been reloaded or rebound since the keymap was built
+        if self._keymap_version != self.config.settings_version:
+            self._build_game_keymap()
+        
         # Initialize game objects
         self.snake = Snake(self.grid_width, self.grid_height, self.config.gameplay.default_speed)
-        self.food = Food(self.grid_width, self.grid_height, self.snake.body)
+        self.food = Food(self.grid_width, self.grid_height, self.snake.body, self.snake.occupied)
         self.powerups = []
-        self.particles = []
-        self.obstacles = []
+        self.particles.clear()
+        self.obstacles = set()
+        self._obstacle_layer = None
         
         # Reset game variables
         self.score = 0
         self.level = 1
         self.game_stats = GameStats()
+        self.frame_count = 0
+        self._schedule_powerup()
         
         # Mode-specific setup
         if self.current_mode == GameMode.MAZE:
@@ -738,17 +1101,11 @@ class Game:
         self.ui.update()
         
         # Update background effects
-        self.bg_hue = (self.bg_hue + 0.01) % 1.0
-        
-        # Update particles
-        for particle in self.particles[:]:
-            particle.update()
-            if not particle.is_alive():
-                self.particles.remove(particle)
+        self.bg_phase = (self.bg_phase + 655) & 0xFFFF
         
-        # Limit particles for performance
-        if len(self.particles) > self.config.gameplay.max_particles:
-            self.particles = self.particles[-self.config.gameplay.max_particles:]
+        # Update particles (the pool itself enforces max_particles); with
+        # threaded_particles this overlaps the gameplay update below
+        self.particles.step_async()
         
         # Game-specific updates
         if self.state == GameState.PLAYING:
@@ -759,6 +1116,8 @@ class Game:
         if not self.snake:
             return
         
+        self.frame_count += 1
+        
         # Update snake
         self.snake.update()
         
@@ -771,16 +1130,17 @@ class Game:
         if self.snake.body[0] == self.food.position:
             self.eat_food()
         
-        # Check power-up collisions
-        for powerup in self.powerups[:]:
-            if self.snake.body[0] == powerup.position:
-                self.eat_powerup(powerup)
-                self.powerups.remove(powerup)
-        
-        # Remove expired power-ups
-        for powerup in self.powerups[:]:
-            if powerup.is_expired():
-                self.powerups.remove(powerup)
+        # Collect eaten power-ups and drop expired ones in a single pass
+        if self.powerups:
+            head = self.snake.body[0]
+            now = time.time()
+            remaining = []
+            for powerup in self.powerups:
+                if powerup.position == head:
+                    self.eat_powerup(powerup)
+                elif not powerup.is_expired(now):
+                    remaining.append(powerup)
+            self.powerups = remaining
         
         # Spawn power-ups
         self.spawn_powerup()
@@ -817,7 +1177,7 @@ class Game:
             self.game_stats.food_eaten += 1
         
         # Spawn new food
-        self.food = Food(self.grid_width, self.grid_height, self.snake.body)
+        self.food = Food(self.grid_width, self.grid_height, self.snake.body, self.snake.occupied)
         
         # Play sound
         if self.audio:
@@ -843,9 +1203,24 @@ class Game:
         if not self.config.gameplay.power_ups_enabled:
             return
         
-        if len(self.powerups) < 2 and random.random() < 0.005:
-            powerup = PowerUp(self.grid_width, self.grid_height, self.snake.body)
+        if self.frame_count < self._next_powerup_frame:
+            return
+        
+        if len(self.powerups) < 2:
+            powerup = PowerUp(self.grid_width, self.grid_height, self.snake.body,
+                              self.snake.occupied)
             self.powerups.append(powerup)
+        self._schedule_powerup()
+    
+    def _schedule_powerup(self):
+        """Pick the frame of the next spawn attempt.
+        
+        Spawning with probability POWERUP_CHANCE each frame means the wait
+        between spawns is geometrically distributed, so draw it once
+        instead of rolling the dice every frame.
+        """
+        wait = math.log(1.0 - random.random()) / math.log(1.0 - self.POWERUP_CHANCE)
+        self._next_powerup_frame = self.frame_count + int(wait) + 1
     
     def create_food_particles(self):
         """Create particles when food is eaten."""
@@ -857,84 +1232,92 @@ class Game:
         
         colors = [(255, 0, 0), (255, 100, 0), (255, 200, 0)]
         
-        for _ in range(15):
-            velocity = (random.uniform(-4, 4), random.uniform(-6, 2))
-            color = random.choice(colors)
-            particle = Particle(center_x, center_y, velocity, color, 45)
-            self.particles.append(particle)
+        self.particles.burst(center_x, center_y, 15, (-4, 4), (-6, 2), colors, 45)
     
     def create_powerup_particles(self, powerup: PowerUp):
         """Create particles when power-up is collected."""
         center_x = powerup.position.x * self.grid_size + self.grid_size // 2
         center_y = powerup.position.y * self.grid_size + self.grid_size // 2
         
-        color = powerup.properties[powerup.type]['color']
+        color = PowerUp.PROPERTIES[powerup.type]['color']
         
-        for _ in range(20):
-            velocity = (random.uniform(-5, 5), random.uniform(-7, 3))
-            particle = Particle(center_x, center_y, velocity, color, 60, size=4)
-            self.particles.append(particle)
+        self.particles.burst(center_x, center_y, 20, (-5, 5), (-7, 3), [color], 60, size=4)
     
     def generate_maze(self):
         """Generate maze for maze mode."""
         # Simple maze generation - add obstacles around the edges and some internal walls
-        self.obstacles = []
+        self.obstacles = set()
         
         # Border obstacles (leaving some gaps)
         for x in range(self.grid_width):
             if x % 4 != 0:  # Leave gaps
-                self.obstacles.append(Position(x, 0))
-                self.obstacles.append(Position(x, self.grid_height - 1))
+                self.obstacles.add(Position(x, 0))
+                self.obstacles.add(Position(x, self.grid_height - 1))
         
         for y in range(self.grid_height):
             if y % 4 != 0:
-                self.obstacles.append(Position(0, y))
-                self.obstacles.append(Position(self.grid_width - 1, y))
+                self.obstacles.add(Position(0, y))
+                self.obstacles.add(Position(self.grid_width - 1, y))
+        
+        # Internal obstacles, kept off the snake and the food
+        count = self.grid_width * self.grid_height // 20
+        if HAS_NUMPY:
+            xs = np.random.randint(2, self.grid_width - 2, count)
+            ys = np.random.randint(2, self.grid_height - 2, count)
+            cells = ys * self.grid_width + xs
+            free = np.frombuffer(self.snake.occupied, np.uint8)[cells] == 0
+            free &= cells != self.food.position.y * self.grid_width + self.food.position.x
+            self.obstacles.update(map(Position, xs[free].tolist(), ys[free].tolist()))
+        else:
+            for _ in range(count):
+                x = random.randint(2, self.grid_width - 3)
+                y = random.randint(2, self.grid_height - 3)
+                pos = Position(x, y)
+                if not self.snake.occupies(pos) and pos != self.food.position:
+                    self.obstacles.add(pos)
         
-        # Internal obstacles
-        for _ in range(self.grid_width * self.grid_height // 20):
-            x = random.randint(2, self.grid_width - 3)
-            y = random.randint(2, self.grid_height - 3)
-            pos = Position(x, y)
-            if pos not in self.snake.body and pos != self.food.position:
-                self.obstacles.append(pos)
+        self._build_obstacle_layer()
+    
+    def _build_obstacle_layer(self):
+        """Render every obstacle onto one colour-keyed layer; obstacles never move."""
+        if not self.obstacles:
+            self._obstacle_layer = None
+            return
+        layer = pygame.Surface(self.screen.get_size())
+        layer.set_colorkey((0, 0, 0), pygame.RLEACCEL)
+        size = self.grid_size
+        for pos in self.obstacles:
+            layer.fill((100, 100, 100), (pos.x * size, pos.y * size, size, size))
+        self._obstacle_layer = layer.convert()
     
     def draw(self):
         """Draw everything."""
-        # Clear screen
-        self.screen.fill(self.config.get_theme_colors()['background'])
+        if self._theme_version != self.config.settings_version:
+            self._refresh_theme()
         
-        # Draw background effects
-        if self.config.theme.rainbow_background:
+        # Clear screen and draw background effects
+        if self._rainbow_background:
             self.draw_rainbow_background()
+        else:
+            self.screen.fill(self._bg_color)
         
         # Draw game elements
-        if self.state in [GameState.PLAYING, GameState.PAUSED, GameState.GAME_OVER]:
+        if self.state in _DRAW_STATES:
             self.draw_game()
         
         # Draw particles
-        for particle in self.particles:
-            particle.draw(self.screen)
+        self.particles.draw(self.screen)
         
         # Draw UI
         game_state_data = None
-        if self.snake and self.state != GameState.MENU:
-            current_song = None
-            if self.audio:
-                song_info = self.audio.get_current_song_info()
-                if song_info:
-                    current_song = song_info.get('title', 'Unknown')
-            
-            effects = {}
-            for effect, timer in self.snake.effects.items():
-                if timer > 0 and effect != 'score_multiplier_timer':
-                    effects[effect] = timer
+        if self.snake and self.state is not GameState.MENU:
+            current_song = self._poll_current_song()
             
             game_state_data = {
                 'score': self.score,
                 'length': len(self.snake.body),
                 'speed': self.snake.get_current_speed(),
-                'effects': effects,
+                'effects': self.snake.active_effects,
                 'current_song': current_song,
                 'is_high_score': False  # Updated in game_over
             }
@@ -947,31 +1330,52 @@ class Game:
         
         pygame.display.flip()
     
-    def draw_rainbow_background(self):
+    def _refresh_theme(self):
+        """Re-read the theme settings draw() uses every frame."""
+        self._bg_color = self.config.get_theme_colors()['background']
+        self._rainbow_background = self.config.theme.rainbow_background
+        self._theme_version = self.config.settings_version
+    
+    def _build_rainbow_cache(self, width: int, strip_height: int) -> pygame.Surface:
+        """Render one full hue cycle of strips, plus enough to wrap a screenful."""
+        step = 256 // self.RAINBOW_CYCLE
+        cache = pygame.Surface((width, strip_height * (self.RAINBOW_CYCLE + self.RAINBOW_STRIPS)))
+        for k in range(self.RAINBOW_CYCLE + self.RAINBOW_STRIPS):
+            cache.fill(_BACKGROUND_LUT[(k * step) & 255], (0, k * strip_height, width, strip_height))
+        return cache.convert()
+    
+    def _poll_current_song(self) -> Optional[str]:
+        """Return the current song title, looked up at most every SONG_POLL_INTERVAL."""
+        now = time.monotonic()
+        if now - self._last_song_poll >= self.SONG_POLL_INTERVAL:
+            self._last_song_poll = now
+            song_info = self.audio.get_current_song_info() if self.audio else None
+            self._current_song = song_info.get('title', 'Unknown') if song_info else None
+        return self._current_song
+    
+    def draw_rainbow_background(self, surface: Optional[pygame.Surface] = None):
         """Draw animated rainbow background."""
-        strip_height = self.screen.get_height() // 30
-        
-        for i in range(30):
-            hue = (self.bg_hue + i * 0.03) % 1.0
-            # Simple color cycling
-            r = int(127 + 127 * math.sin(hue * 2 * math.pi))
-            g = int(127 + 127 * math.sin((hue + 0.33) * 2 * math.pi))
-            b = int(127 + 127 * math.sin((hue + 0.66) * 2 * math.pi))
-            
-            # Make it darker for background
-            color = (r // 8, g // 8, b // 8)
-            
-            pygame.draw.rect(self.screen, color, 
-                           (0, i * strip_height, self.screen.get_width(), strip_height))
+        surface = surface or self.screen
+        width, height = surface.get_size()
+        strip_height = height // self.RAINBOW_STRIPS
+        cache = self._rainbow_cache
+        cache_size = (width, strip_height * (self.RAINBOW_CYCLE + self.RAINBOW_STRIPS))
+        if cache is None or cache.get_size() != cache_size:
+            cache = self._rainbow_cache = self._build_rainbow_cache(width, strip_height)
+        
+        # Each strip is the next hue step down the cache, so advancing the hue
+        # is just a matter of starting the window further down
+        first = (self.bg_phase * self.RAINBOW_CYCLE >> 16) % self.RAINBOW_CYCLE
+        band = strip_height * self.RAINBOW_STRIPS
+        surface.blit(cache, (0, 0), (0, first * strip_height, width, band))
+        if band < height:
+            surface.fill(self._bg_color, (0, band, width, height - band))
     
     def draw_game(self):
         """Draw game elements."""
         # Draw obstacles (maze mode)
-        for obstacle in self.obstacles:
-            x = obstacle.x * self.grid_size
-            y = obstacle.y * self.grid_size
-            pygame.draw.rect(self.screen, (100, 100, 100), 
-                           (x, y, self.grid_size, self.grid_size))
+        if self._obstacle_layer is not None:
+            self.screen.blit(self._obstacle_layer, (0, 0))
         
         # Draw food
         if self.food:
@@ -979,7 +1383,7 @@ class Game:
         
         # Draw power-ups
         for powerup in self.powerups:
-            powerup.draw(self.screen, self.grid_size, self.small_font)
+            powerup.draw(self.screen, self.grid_size, self._symbol_surfaces)
         
         # Draw snake
         if self.snake:
@@ -988,38 +1392,62 @@ class Game:
     def draw_debug_info(self):
         """Draw debug information."""
         debug_info = [
-            f"FPS: {self.clock.get_fps():.1f}",
+            f"FPS: {self.clock.get_fps():.0f}",
             f"State: {self.state.value}",
             f"Snake Length: {len(self.snake.body) if self.snake else 0}",
             f"Particles: {len(self.particles)}",
             f"Power-ups: {len(self.powerups)}",
         ]
         
+        x = self.screen.get_width() - 200
         y_offset = 10
         for info in debug_info:
-            text = self.small_font.render(info, True, (255, 255, 0))
-            self.screen.blit(text, (self.screen.get_width() - 200, y_offset))
+            text = self.text_cache.render(self.small_font, info, (255, 255, 0))
+            self.screen.blit(text, (x, y_offset))
             y_offset += 25
     
     def toggle_fullscreen(self):
         """Toggle fullscreen mode."""
         self.config.display.fullscreen = not self.config.display.fullscreen
         width, height, flags = self.config.get_display_mode()
-        self.screen = pygame.display.set_mode((width, height), flags)
+        # A SCALED display (used with vsync) keeps its logical size, so SDL can
+        # switch in place and every cached surface stays valid
+        toggled = False
+        if flags & pygame.SCALED:
+            try:
+                toggled = bool(pygame.display.toggle_fullscreen())
+            except pygame.error:
+                pass
+        if not toggled:
+            self.screen = pygame.display.set_mode((width, height), flags)
+            for invalidate in self._cache_invalidators:
+                invalidate()
         
         # Recalculate grid
         self.grid_width = width // self.grid_size
         self.grid_height = height // self.grid_size
     
+    def _reset_surface_caches(self):
+        """Drop surfaces converted for the previous display mode."""
+        self._rainbow_cache = None
+        self.particles.clear_sprites()
+        _BODY_TILES.clear()
+        _HEAD_TILES.clear()
+    
     def cleanup(self):
         """Clean up resources."""
-        # Save configuration
+        # Save configuration, writing it out on a worker while the mixer shuts
+        # down; both wait on I/O and neither touches the other's state
         self.config.save_config()
+        saver = threading.Thread(target=self.config.flush, name="config-flush")
+        saver.start()
         
         # Clean up audio
         if self.audio:
             self.audio.cleanup()
         
+        self.particles.close()
+        saver.join()
         pygame.quit()
         print("SNAKEIUM 2.1 shut down successfully")
 
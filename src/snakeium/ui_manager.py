@@ -4,13 +4,11 @@ Handles all user interface elements, menus, HUD, and visual feedback.
 """
 
 import pygame
-import math
 import time
-from typing import List, Tuple, Dict, Optional, Any
+from typing import List, NamedTuple, Tuple, Dict, Optional, Any
 from enum import Enum
-from dataclasses import dataclass
 
-from .config_manager import GameMode, Theme
+from .config_manager import GameMode
 from .audio_manager import AudioEvent
 
 
@@ -25,14 +23,50 @@ class MenuState(Enum):
     ABOUT = "about"
 
 
-@dataclass
-class MenuItem:
+class MenuItem(NamedTuple):
     text: str
     action: str
     value: Any = None
     enabled: bool = True
 
 
+# Game modes in declaration order, for the high score table
+_GAME_MODES = tuple(GameMode)
+
+
+# fblits arrived in pygame 2.6; older versions fall back to blits
+_HAS_FBLITS = hasattr(pygame.Surface, 'fblits')
+
+
+def _blit_batch(screen: pygame.Surface, blits: List[Tuple[pygame.Surface, Any]]):
+    """Blit a list of (surface, dest) pairs in one call."""
+    if _HAS_FBLITS:
+        screen.fblits(blits)
+    else:
+        screen.blits(blits, False)
+
+
+class TextCache:
+    """Rendered text surfaces keyed by (font, text, color), evicted oldest first."""
+    
+    def __init__(self, size: int = 128):
+        self.size = size
+        self._surfaces: Dict[Tuple[int, str, Tuple[int, int, int]], pygame.Surface] = {}
+    
+    def render(self, font: pygame.font.Font, text: str,
+               color: Tuple[int, int, int]) -> pygame.Surface:
+        key = (id(font), text, tuple(color))
+        surf = self._surfaces.get(key)
+        if surf is None:
+            if len(self._surfaces) >= self.size:
+                del self._surfaces[next(iter(self._surfaces))]
+            surf = self._surfaces[key] = font.render(text, True, color)
+        return surf
+    
+    def clear(self):
+        self._surfaces.clear()
+
+
 class UIElement:
     """Base class for UI elements."""
     
@@ -44,7 +78,7 @@ class UIElement:
         self.visible = True
         self.enabled = True
     
-    def update(self):
+    def update(self, mouse_pos: Optional[Tuple[int, int]] = None):
         pass
     
     def draw(self, screen: pygame.Surface):
@@ -60,6 +94,7 @@ class Button(UIElement):
     def __init__(self, x: int, y: int, width: int, height: int, text: str, 
                  font: pygame.font.Font, colors: Dict[str, Tuple[int, int, int]]):
         super().__init__(x, y, width, height)
+        self._state_surfaces: Dict[str, pygame.Surface] = {}
         self.text = text
         self.font = font
         self.colors = colors
@@ -67,12 +102,31 @@ class Button(UIElement):
         self.pressed = False
         self.callback = None
     
+    @property
+    def text(self) -> str:
+        return self._text
+    
+    @text.setter
+    def text(self, value: str):
+        self._text = value
+        self._state_surfaces.clear()
+    
+    @property
+    def colors(self) -> Dict[str, Tuple[int, int, int]]:
+        return self._colors
+    
+    @colors.setter
+    def colors(self, value: Dict[str, Tuple[int, int, int]]):
+        self._colors = value
+        self._state_surfaces.clear()
+    
     def set_callback(self, callback):
         self.callback = callback
     
-    def update(self):
+    def update(self, mouse_pos: Optional[Tuple[int, int]] = None):
         # Check mouse hover
-        mouse_pos = pygame.mouse.get_pos()
+        if mouse_pos is None:
+            mouse_pos = pygame.mouse.get_pos()
         self.hovered = (self.x <= mouse_pos[0] <= self.x + self.width and
                        self.y <= mouse_pos[1] <= self.y + self.height)
     
@@ -80,27 +134,24 @@ class Button(UIElement):
         if not self.visible:
             return
         
-        # Choose colors based on state
-        if self.pressed:
-            bg_color = self.colors.get('pressed', self.colors['normal'])
-            text_color = self.colors.get('text_pressed', self.colors['text'])
-        elif self.hovered:
-            bg_color = self.colors.get('hover', self.colors['normal'])
-            text_color = self.colors.get('text_hover', self.colors['text'])
-        else:
-            bg_color = self.colors['normal']
-            text_color = self.colors['text']
+        state = 'pressed' if self.pressed else 'hover' if self.hovered else 'normal'
+        surface = self._state_surfaces.get(state)
+        if surface is None:
+            surface = self._state_surfaces[state] = self._render_state(state)
+        screen.blit(surface, (self.x, self.y))
+    
+    def _render_state(self, state: str) -> pygame.Surface:
+        """Compose the background, border and label for one button state."""
+        bg_color = self.colors.get(state, self.colors['normal'])
+        text_color = self.colors.get(f'text_{state}', self.colors['text'])
         
-        # Draw button background
-        pygame.draw.rect(screen, bg_color, (self.x, self.y, self.width, self.height))
-        pygame.draw.rect(screen, self.colors.get('border', text_color), 
-                        (self.x, self.y, self.width, self.height), 2)
+        surface = pygame.Surface((self.width, self.height)).convert()
+        surface.fill(bg_color)
+        pygame.draw.rect(surface, self.colors.get('border', text_color), surface.get_rect(), 2)
         
-        # Draw text
         text_surface = self.font.render(self.text, True, text_color)
-        text_rect = text_surface.get_rect(center=(self.x + self.width // 2, 
-                                                 self.y + self.height // 2))
-        screen.blit(text_surface, text_rect)
+        surface.blit(text_surface, text_surface.get_rect(center=(self.width // 2, self.height // 2)))
+        return surface
     
     def handle_event(self, event: pygame.event.Event) -> bool:
         if not self.enabled or not self.visible:
@@ -189,6 +240,21 @@ class Slider(UIElement):
 class MenuManager:
     """Manages game menus and navigation."""
     
+    ABOUT_LINES = (
+        "SNAKEIUM 2.0 - GHOSTKITTY Edition",
+        "A modern retro Snake game with epic music",
+        "",
+        "Created by: GHOSTKITTY APPS",
+        "Version: 2.0.0",
+        "License: MIT",
+        "",
+        "Made for the retro gaming community."
+    )
+    
+    # Animated background: strip count and hue steps around the colour wheel
+    BG_STRIPS = 20
+    BG_PALETTE_SIZE = 256
+    
     def __init__(self, screen: pygame.Surface, config_manager, audio_manager):
         self.screen = screen
         self.config = config_manager
@@ -202,6 +268,7 @@ class MenuManager:
         self.large_font = pygame.font.Font(None, 64)
         self.medium_font = pygame.font.Font(None, 48)
         self.small_font = pygame.font.Font(None, 32)
+        self.text_cache = TextCache()
         
         # Colors from theme
         self.colors = self.config.get_theme_colors()
@@ -250,13 +317,77 @@ class MenuManager:
             ]
         }
         
-        # UI elements
+        # Dim background hues, indexed by hue step
+        self._bg_palette: Tuple[Tuple[int, int, int], ...] = ()
+        self._rebuild_bg_palette()
+        
+        # Fixed titles and labels, rendered once per menu
+        self.static_text: Dict[MenuState, List[Tuple[pygame.Surface, Any]]] = {}
+        self._build_static_text()
+        
+        # UI elements, and the pointer position they were last updated for
         self.ui_elements = []
+        self._last_mouse_pos: Optional[Tuple[int, int]] = None
         self.build_ui_elements()
+        
+        # High score table, laid out when the menu is opened
+        self._high_score_blits: List[Tuple[pygame.Surface, Any]] = []
+        
+        # Menu item blits for the last (menu, y_start, selection) drawn
+        self._item_blits: List[Tuple[pygame.Surface, Tuple[int, int]]] = []
+        self._item_blits_key: Optional[Tuple[MenuState, int, int]] = None
+    
+    def _rebuild_bg_palette(self):
+        """Precompute the animated background colours once instead of per strip per frame."""
+        color = pygame.Color(0)
+        palette = []
+        for step in range(self.BG_PALETTE_SIZE):
+            color.hsva = (step * 360 / self.BG_PALETTE_SIZE, 30, 20, 100)
+            palette.append((color.r, color.g, color.b))
+        self._bg_palette = tuple(palette)
+    
+    def _build_static_text(self):
+        """Render the text that never changes, positioned for the current screen."""
+        center_x = self.screen.get_width() // 2
+        
+        def centered(font, text, color, y):
+            surf = font.render(text, True, color)
+            return surf, surf.get_rect(center=(center_x, y))
+        
+        about = [centered(self.large_font, "About SNAKEIUM", self.colors['neon_orange'], 100)]
+        for i, line in enumerate(self.ABOUT_LINES):
+            if line:
+                about.append(centered(self.small_font, line, self.colors['ui_text'], 180 + i * 30))
+        
+        self.static_text = {
+            MenuState.MAIN: [
+                centered(self.large_font, "SNAKEIUM 2.1", self.colors['neon_green'], 150),
+                centered(self.medium_font, "GHOSTKITTY Edition", self.colors['neon_pink'], 200),
+            ],
+            MenuState.HIGH_SCORES: [
+                centered(self.large_font, "High Scores", self.colors['neon_yellow'], 100),
+            ],
+            MenuState.AUDIO: [
+                centered(self.large_font, "Audio Settings", self.colors['neon_blue'], 100),
+                (self.medium_font.render("Music Volume", True, self.colors['ui_text']), (100, 300)),
+                (self.medium_font.render("Sound Effects", True, self.colors['ui_text']), (100, 350)),
+            ],
+            MenuState.GRAPHICS: [
+                centered(self.large_font, "Graphics Settings", self.colors['neon_purple'], 100),
+            ],
+            MenuState.ABOUT: about,
+        }
+        
+        # Menus without their own layout just show their name as the title
+        for state in MenuState:
+            if state not in self.static_text:
+                title = state.value.replace('_', ' ').title()
+                self.static_text[state] = [centered(self.large_font, title, self.colors['neon_green'], 150)]
     
     def build_ui_elements(self):
         """Build UI elements for current menu."""
         self.ui_elements.clear()
+        self._last_mouse_pos = None
         
         if self.current_menu == MenuState.AUDIO:
             # Music volume slider
@@ -298,8 +429,14 @@ class MenuManager:
     
     def update(self):
         """Update menu state and UI elements."""
+        # Elements only react to the pointer, so there is nothing to do
+        # until it moves
+        mouse_pos = pygame.mouse.get_pos()
+        if mouse_pos == self._last_mouse_pos:
+            return
+        self._last_mouse_pos = mouse_pos
         for element in self.ui_elements:
-            element.update()
+            element.update(mouse_pos)
     
     def draw(self):
         """Draw the current menu."""
@@ -332,73 +469,60 @@ class MenuManager:
         if not self.config.theme.rainbow_background:
             return
         
-        # Rainbow background strips
-        hue = (time.time() * 0.1) % 1.0
-        strip_height = self.screen.get_height() // 20
+        # Rainbow background strips, the hue turning once every ten seconds
+        palette = self._bg_palette
+        size = self.BG_PALETTE_SIZE
+        strips = self.BG_STRIPS
+        base = int(time.time() * 0.1 * size)
+        width = self.screen.get_width()
+        strip_height = self.screen.get_height() // strips
         
-        for i in range(20):
-            color_hue = (hue + i * 0.05) % 1.0
-            r, g, b = [int(x * 255) for x in pygame.Color(0).hsva[:3]]
-            color = pygame.Color(0)
-            color.hsva = (color_hue * 360, 30, 20, 100)
-            pygame.draw.rect(self.screen, color, 
-                           (0, i * strip_height, self.screen.get_width(), strip_height))
+        fill = self.screen.fill
+        for i in range(strips):
+            fill(palette[(base + i * size // strips) % size], (0, i * strip_height, width, strip_height))
     
     def draw_main_menu(self):
         """Draw the main menu."""
-        # Title
-        title_text = self.large_font.render("SNAKEIUM 2.1", True, self.colors['neon_green'])
-        title_rect = title_text.get_rect(center=(self.screen.get_width() // 2, 150))
-        self.screen.blit(title_text, title_rect)
-        
-        subtitle_text = self.medium_font.render("GHOSTKITTY Edition", True, self.colors['neon_pink'])
-        subtitle_rect = subtitle_text.get_rect(center=(self.screen.get_width() // 2, 200))
-        self.screen.blit(subtitle_text, subtitle_rect)
+        # Title and subtitle
+        _blit_batch(self.screen, self.static_text[MenuState.MAIN])
         
         # Menu items
         self.draw_menu_items(MenuState.MAIN, 300)
     
     def draw_high_scores(self):
         """Draw high scores menu."""
-        title_text = self.large_font.render("High Scores", True, self.colors['neon_yellow'])
-        title_rect = title_text.get_rect(center=(self.screen.get_width() // 2, 100))
-        self.screen.blit(title_text, title_rect)
+        _blit_batch(self.screen, self._high_score_blits)
         
-        # Display scores for each mode
+        # Back button
+        self.draw_menu_items(MenuState.HIGH_SCORES, 180 + len(_GAME_MODES) * 150)
+    
+    def _layout_high_scores(self) -> List[Tuple[pygame.Surface, Any]]:
+        """Render the title plus each mode's top five scores, under one another."""
+        render = self.text_cache.render
+        blits = list(self.static_text[MenuState.HIGH_SCORES])
         y_offset = 180
-        for mode in GameMode:
-            mode_text = self.medium_font.render(mode.value.title(), True, self.colors['ui_text'])
-            self.screen.blit(mode_text, (100, y_offset))
+        for mode in _GAME_MODES:
+            blits.append((render(self.medium_font, mode.value.title(), self.colors['ui_text']),
+                          (100, y_offset)))
             
             scores = self.config.get_high_scores(mode.value, 5)
             for i, score in enumerate(scores):
-                score_text = self.small_font.render(f"{i+1}. {score:,}", True, self.colors['neon_green'])
-                self.screen.blit(score_text, (300, y_offset + i * 25))
+                blits.append((render(self.small_font, f"{i+1}. {score:,}", self.colors['neon_green']),
+                              (300, y_offset + i * 25)))
             
             y_offset += 150
-        
-        # Back button
-        self.draw_menu_items(MenuState.HIGH_SCORES, y_offset)
+        return blits
     
     def draw_audio_menu(self):
         """Draw audio settings menu."""
-        title_text = self.large_font.render("Audio Settings", True, self.colors['neon_blue'])
-        title_rect = title_text.get_rect(center=(self.screen.get_width() // 2, 100))
-        self.screen.blit(title_text, title_rect)
-        
-        # Music volume
-        music_text = self.medium_font.render("Music Volume", True, self.colors['ui_text'])
-        self.screen.blit(music_text, (100, 300))
-        
-        # SFX volume
-        sfx_text = self.medium_font.render("Sound Effects", True, self.colors['ui_text'])
-        self.screen.blit(sfx_text, (100, 350))
+        # Title and the music/SFX volume labels
+        _blit_batch(self.screen, self.static_text[MenuState.AUDIO])
         
         # Current song info
         song_info = self.audio.get_current_song_info()
         if song_info:
-            info_text = self.small_font.render(f"{song_info['title']} - {song_info['artist']}", 
-                                             True, self.colors['neon_pink'])
+            info_text = self.text_cache.render(self.small_font, f"{song_info['title']} - {song_info['artist']}",
+                                               self.colors['neon_pink'])
             self.screen.blit(info_text, (100, 450))
         
         # Back button
@@ -406,13 +530,11 @@ class MenuManager:
     
     def draw_graphics_menu(self):
         """Draw graphics settings menu."""
-        title_text = self.large_font.render("Graphics Settings", True, self.colors['neon_purple'])
-        title_rect = title_text.get_rect(center=(self.screen.get_width() // 2, 100))
-        self.screen.blit(title_text, title_rect)
+        _blit_batch(self.screen, self.static_text[MenuState.GRAPHICS])
         
         # Current resolution
-        res_text = self.medium_font.render(f"Resolution: {self.config.display.width}x{self.config.display.height}", 
-                                         True, self.colors['ui_text'])
+        res_text = self.text_cache.render(self.medium_font, f"Resolution: {self.config.display.width}x{self.config.display.height}",
+                                          self.colors['ui_text'])
         self.screen.blit(res_text, (100, 150))
         
         # Back button
@@ -420,58 +542,46 @@ class MenuManager:
     
     def draw_about_menu(self):
         """Draw about menu."""
-        title_text = self.large_font.render("About SNAKEIUM", True, self.colors['neon_orange'])
-        title_rect = title_text.get_rect(center=(self.screen.get_width() // 2, 100))
-        self.screen.blit(title_text, title_rect)
-        
-        about_lines = [
-            "SNAKEIUM 2.0 - GHOSTKITTY Edition",
-            "A modern retro Snake game with epic music",
-            "",
-            "Created by: GHOSTKITTY APPS",
-            "Version: 2.0.0",
-            "License: MIT",
-            "",
-            "Made for the retro gaming community."
-        ]
+        _blit_batch(self.screen, self.static_text[MenuState.ABOUT])
         
-        y_offset = 180
-        for line in about_lines:
-            if line:
-                text = self.small_font.render(line, True, self.colors['ui_text'])
-                text_rect = text.get_rect(center=(self.screen.get_width() // 2, y_offset))
-                self.screen.blit(text, text_rect)
-            y_offset += 30
-        
-        # Back button
-        self.draw_menu_items(MenuState.ABOUT, y_offset + 50)
+        # Back button, below the last about line
+        self.draw_menu_items(MenuState.ABOUT, 180 + len(self.ABOUT_LINES) * 30 + 50)
     
     def draw_generic_menu(self):
         """Draw a generic menu layout."""
         # Title
-        title = self.current_menu.value.replace('_', ' ').title()
-        title_text = self.large_font.render(title, True, self.colors['neon_green'])
-        title_rect = title_text.get_rect(center=(self.screen.get_width() // 2, 150))
-        self.screen.blit(title_text, title_rect)
+        _blit_batch(self.screen, self.static_text[self.current_menu])
         
         # Menu items
         self.draw_menu_items(self.current_menu, 250)
     
     def draw_menu_items(self, menu_state: MenuState, y_start: int):
         """Draw menu items for the given state."""
+        # The layout only changes with the menu and the selection
+        key = (menu_state, y_start, self.selected_index)
+        if key != self._item_blits_key:
+            self._item_blits = self._layout_menu_items(*key)
+            self._item_blits_key = key
+        _blit_batch(self.screen, self._item_blits)
+    
+    def _layout_menu_items(self, menu_state: MenuState, y_start: int,
+                           selected: int) -> List[Tuple[pygame.Surface, Tuple[int, int]]]:
+        """Render and position the items of a menu, centred one below another."""
         items = self.menu_items.get(menu_state, [])
+        center_x = self.screen.get_width() // 2
         
+        blits = []
         for i, item in enumerate(items):
-            color = self.colors['neon_green'] if i == self.selected_index else self.colors['ui_text']
+            color = self.colors['neon_green'] if i == selected else self.colors['ui_text']
             if not item.enabled:
                 color = (100, 100, 100)
             
             # Selection indicator
-            prefix = "> " if i == self.selected_index else "  "
+            prefix = "> " if i == selected else "  "
             
-            text = self.medium_font.render(f"{prefix}{item.text}", True, color)
-            text_rect = text.get_rect(center=(self.screen.get_width() // 2, y_start + i * 50))
-            self.screen.blit(text, text_rect)
+            text = self.text_cache.render(self.medium_font, f"{prefix}{item.text}", color)
+            blits.append((text, text.get_rect(center=(center_x, y_start + i * 50)).topleft))
+        return blits
     
     def handle_event(self, event: pygame.event.Event) -> Optional[str]:
         """Handle menu events and return action if any."""
@@ -524,6 +634,10 @@ class MenuManager:
         self.current_menu = menu_state
         self.selected_index = 0
         self.build_ui_elements()
+        
+        # Scores only change between games, so lay them out on the way in
+        if menu_state == MenuState.HIGH_SCORES:
+            self._high_score_blits = self._layout_high_scores()
     
     def go_back(self) -> Optional[str]:
         """Go back to previous menu or quit."""
@@ -539,117 +653,136 @@ class MenuManager:
 class HUD:
     """Heads-up display for in-game UI."""
     
+    # Weight of the newest frame in the smoothed FPS reading
+    FPS_SMOOTHING = 0.1
+    
+    # Theme colour used to label each power-up effect
+    EFFECT_COLOR_KEYS = {
+        'speed_boost': 'neon_blue',
+        'score_multiplier': 'neon_yellow',
+        'rainbow_mode': 'neon_purple'
+    }
+    
     def __init__(self, screen: pygame.Surface, config_manager):
         self.screen = screen
         self.config = config_manager
         self.colors = config_manager.get_theme_colors()
+        self.effect_colors = {effect: self.colors[key] for effect, key in self.EFFECT_COLOR_KEYS.items()}
         
         # Fonts
         self.font = pygame.font.Font(None, 36)
         self.small_font = pygame.font.Font(None, 24)
+        self.text_cache = TextCache()
         
         # Animation state
         self.pulse_timer = 0
+        
+        # Dimming overlays for the pause and game-over screens, keyed by alpha
+        self._overlays: Dict[int, pygame.Surface] = {}
+        
+        # Frame rate, measured across update() calls
+        self._last_frame_time = time.perf_counter()
+        self.fps = 0.0
     
     def update(self):
         """Update HUD animations."""
         self.pulse_timer += 0.1
+        
+        now = time.perf_counter()
+        dt = now - self._last_frame_time
+        self._last_frame_time = now
+        if dt > 0:
+            self.fps += self.FPS_SMOOTHING * (1.0 / dt - self.fps)
     
     def draw_game_hud(self, score: int, length: int, speed: int, effects: Dict[str, int], 
                      current_song: Optional[str] = None):
         """Draw the main game HUD."""
-        # Score
-        score_text = self.font.render(f"Score: {score:,}", True, self.colors['ui_text'])
-        self.screen.blit(score_text, (10, 10))
-        
-        # Snake length
-        length_text = self.font.render(f"Length: {length}", True, self.colors['ui_text'])
-        self.screen.blit(length_text, (10, 50))
-        
-        # Speed
-        speed_text = self.font.render(f"Speed: {speed}", True, self.colors['ui_text'])
-        self.screen.blit(speed_text, (10, 90))
+        render = self.text_cache.render
+        blits = [
+            # Score, snake length and speed
+            (render(self.font, f"Score: {score:,}", self.colors['ui_text']), (10, 10)),
+            (render(self.font, f"Length: {length}", self.colors['ui_text']), (10, 50)),
+            (render(self.font, f"Speed: {speed}", self.colors['ui_text']), (10, 90)),
+        ]
         
         # Active effects
+        effect_colors = self.effect_colors
         y_offset = 130
         for effect, timer in effects.items():
             if timer > 0:
-                pulse = abs(math.sin(self.pulse_timer))
-                alpha = int(255 * (0.7 + 0.3 * pulse))
-                
-                effect_color = {
-                    'speed_boost': self.colors['neon_blue'],
-                    'score_multiplier': self.colors['neon_yellow'],
-                    'rainbow_mode': self.colors['neon_purple']
-                }.get(effect, self.colors['ui_text'])
-                
-                effect_text = self.small_font.render(f"{effect.upper()}!", True, effect_color)
-                self.screen.blit(effect_text, (10, y_offset))
+                effect_color = effect_colors.get(effect, self.colors['ui_text'])
+                blits.append((render(self.small_font, f"{effect.upper()}!", effect_color), (10, y_offset)))
                 y_offset += 25
         
+        width, height = self.screen.get_size()
+        
         # Current song
         if current_song:
-            song_text = self.small_font.render(f"{current_song}", True, self.colors['neon_pink'])
-            self.screen.blit(song_text, (10, self.screen.get_height() - 30))
+            blits.append((render(self.small_font, f"{current_song}", self.colors['neon_pink']),
+                          (10, height - 30)))
         
         # FPS counter (if enabled)
         if self.config.display.show_fps:
-            fps = pygame.time.Clock().get_fps()
-            fps_text = self.small_font.render(f"FPS: {fps:.1f}", True, self.colors['ui_text'])
-            fps_rect = fps_text.get_rect(topright=(self.screen.get_width() - 10, 10))
-            self.screen.blit(fps_text, fps_rect)
+            fps_text = render(self.small_font, f"FPS: {self.fps:.0f}", self.colors['ui_text'])
+            blits.append((fps_text, fps_text.get_rect(topright=(width - 10, 10))))
+        
+        _blit_batch(self.screen, blits)
+    
+    def _overlay(self, alpha: int) -> pygame.Surface:
+        """Return a screen-sized black surface at ``alpha``, built once per size."""
+        size = self.screen.get_size()
+        overlay = self._overlays.get(alpha)
+        if overlay is None or overlay.get_size() != size:
+            overlay = pygame.Surface(size).convert()
+            overlay.fill((0, 0, 0))
+            overlay.set_alpha(alpha)
+            self._overlays[alpha] = overlay
+        return overlay
     
     def draw_pause_overlay(self):
         """Draw pause screen overlay."""
+        center_x, center_y = self.screen.get_width() // 2, self.screen.get_height() // 2
+        
         # Semi-transparent overlay
-        overlay = pygame.Surface((self.screen.get_width(), self.screen.get_height()))
-        overlay.fill((0, 0, 0))
-        overlay.set_alpha(128)
-        self.screen.blit(overlay, (0, 0))
+        self.screen.blit(self._overlay(128), (0, 0))
         
         # Pause text
-        pause_text = self.font.render("PAUSED", True, self.colors['neon_yellow'])
-        pause_rect = pause_text.get_rect(center=(self.screen.get_width() // 2, 
-                                                self.screen.get_height() // 2))
+        pause_text = self.text_cache.render(self.font, "PAUSED", self.colors['neon_yellow'])
+        pause_rect = pause_text.get_rect(center=(center_x, center_y))
         self.screen.blit(pause_text, pause_rect)
         
         # Instructions
-        continue_text = self.small_font.render("Press SPACE to continue", True, self.colors['ui_text'])
-        continue_rect = continue_text.get_rect(center=(self.screen.get_width() // 2, 
-                                                      self.screen.get_height() // 2 + 50))
+        continue_text = self.text_cache.render(self.small_font, "Press SPACE to continue", self.colors['ui_text'])
+        continue_rect = continue_text.get_rect(center=(center_x, center_y + 50))
         self.screen.blit(continue_text, continue_rect)
     
     def draw_game_over(self, final_score: int, is_high_score: bool):
         """Draw game over screen."""
+        center_x, center_y = self.screen.get_width() // 2, self.screen.get_height() // 2
+        
         # Semi-transparent overlay
-        overlay = pygame.Surface((self.screen.get_width(), self.screen.get_height()))
-        overlay.fill((0, 0, 0))
-        overlay.set_alpha(180)
-        self.screen.blit(overlay, (0, 0))
+        self.screen.blit(self._overlay(180), (0, 0))
         
         # Game Over text
-        game_over_text = self.font.render("GAME OVER", True, self.colors['neon_orange'])
-        game_over_rect = game_over_text.get_rect(center=(self.screen.get_width() // 2, 
-                                                        self.screen.get_height() // 2 - 50))
+        game_over_text = self.text_cache.render(self.font, "GAME OVER", self.colors['neon_orange'])
+        game_over_rect = game_over_text.get_rect(center=(center_x, center_y - 50))
         self.screen.blit(game_over_text, game_over_rect)
         
         # Final score
-        score_text = self.font.render(f"Final Score: {final_score:,}", True, self.colors['ui_text'])
-        score_rect = score_text.get_rect(center=(self.screen.get_width() // 2, 
-                                                self.screen.get_height() // 2))
+        score_text = self.text_cache.render(self.font, f"Final Score: {final_score:,}", self.colors['ui_text'])
+        score_rect = score_text.get_rect(center=(center_x, center_y))
         self.screen.blit(score_text, score_rect)
         
         # High score notification
         if is_high_score:
-            hs_text = self.small_font.render("NEW HIGH SCORE!", True, self.colors['neon_yellow'])
-            hs_rect = hs_text.get_rect(center=(self.screen.get_width() // 2, 
-                                              self.screen.get_height() // 2 + 40))
+            hs_text = self.text_cache.render(self.small_font, "NEW HIGH SCORE!", self.colors['neon_yellow'])
+            hs_rect = hs_text.get_rect(center=(center_x, center_y + 40))
             self.screen.blit(hs_text, hs_rect)
         
         # Instructions
-        continue_text = self.small_font.render("Press R to restart or ESC for menu", True, self.colors['ui_text'])
-        continue_rect = continue_text.get_rect(center=(self.screen.get_width() // 2, 
-                                                      self.screen.get_height() // 2 + 80))
+        continue_text = self.text_cache.render(self.small_font, "Press R to restart or ESC for menu",
+                                               self.colors['ui_text'])
+        continue_rect = continue_text.get_rect(center=(center_x, center_y + 80))
         self.screen.blit(continue_text, continue_rect)
 
 
@@ -0,0 +1,39 @@
+"""
+Shared pytest setup for the SNAKEIUM test suite
+"""
+
+import os
+import platform
+import sys
+from pathlib import Path
+
+# Make the src layout importable without an install, once per session
+src_path = str(Path(__file__).parent.parent / "src")
+if src_path not in sys.path:
+    sys.path.insert(0, src_path)
+
+# Headless SDL drivers unless the environment picks its own; these must be
+# set before pygame initializes. Windows builds of SDL ship the lighter
+# offscreen video driver.
+os.environ.setdefault('SDL_VIDEODRIVER', 'offscreen' if platform.system() == 'Windows' else 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import pygame
+import pytest
+
+
+@pytest.fixture(scope="session", autouse=True)
+def pygame_session():
+    """Initialize the pygame subsystems the tests use, once per session."""
+    # AudioManager brings up the mixer itself, with its own settings
+    pygame.display.init()
+    pygame.font.init()
+    yield
+    pygame.quit()
+
+
+@pytest.fixture(scope="session")
+def config():
+    """A ConfigManager shared by the tests that only read settings."""
+    from snakeium.config_manager import ConfigManager
+    return ConfigManager()